@@ -0,0 +1,249 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, NamedTuple
+
+from lexorank import lexorank
+from lexorank.base import Base, Base10, Base36, Base64
+from lexorank.decimal import DECIMAL_POINT, Decimal
+from lexorank.lexorank import BUCKET_SEPARATOR, Bucket, LexoRank
+
+BASES: list[Base] = [Base10, Base36, Base64]
+WHOLE_NUMBER_SIZES = [6, 10]
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+    size: int
+
+
+class Result(NamedTuple):
+    ops_per_second: float
+    peak_bytes: int
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark lexorank hot paths.")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="report regressions against a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown or memory growth reported as a regression (default: 0.2)",
+    )
+    parser.add_argument("--size", type=int, default=2000, help="operations per case")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case, best is kept")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    args = parser.parse_args()
+
+    lexorank.disable_parse_cache()
+    results = {}
+    for case in cases(args.size):
+        if args.filter not in case.name:
+            continue
+        result = measure(case, args.repeat)
+        results[case.name] = result._asdict()
+        print(
+            f"{case.name:<40} {result.ops_per_second:>14,.0f} ops/s"
+            f" {result.peak_bytes / 1024:>10,.1f} KiB peak"
+        )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(
+                {"python": platform.python_version(), "size": args.size, "results": results},
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+            file.write("\n")
+
+    if args.compare:
+        try:
+            with open(args.compare, encoding="utf-8") as file:
+                baseline = json.load(file)["results"]
+        except FileNotFoundError:
+            print(f"no baseline at {args.compare}, save one with --save first")
+            return 2
+        regressions = compare(baseline, results, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+def measure(case: Case, repeat: int) -> Result:
+    best = float("inf")
+    for _ in range(repeat):
+        state = case.setup()
+        gc.collect()
+        start = time.perf_counter()
+        case.run(state)
+        best = min(best, time.perf_counter() - start)
+
+    # Timing and allocation tracing are kept apart, as tracemalloc slows every allocation down.
+    state = case.setup()
+    gc.collect()
+    tracemalloc.start()
+    case.run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(case.size / best, peak)
+
+
+def compare(baseline: dict[str, Any], results: dict[str, Any], threshold: float) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]
+        if result["ops_per_second"] < before["ops_per_second"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {before['ops_per_second']:,.0f} -> {result['ops_per_second']:,.0f} ops/s"
+            )
+        if result["peak_bytes"] > before["peak_bytes"] * (1 + threshold):
+            regressions.append(
+                f"{name}: {before['peak_bytes']:,} -> {result['peak_bytes']:,} bytes peak"
+            )
+    return regressions
+
+
+def cases(size: int) -> list[Case]:
+    found = []
+    for base in BASES:
+        for whole_number_size in WHOLE_NUMBER_SIZES:
+            found.extend(_cases(base, whole_number_size, size))
+    found.extend(_readme_cases(size))
+    return found
+
+
+def _cases(base: Base, whole_number_size: int, size: int) -> list[Case]:
+    # Base is a protocol, so the name comes from the radix rather than the class.
+    name = f"Base{base.base()}"
+    rng = random.Random(f"{name}-{whole_number_size}")
+    prefix = f"{name.lower()}/w{whole_number_size}"
+
+    def rank(fraction_digits: int) -> LexoRank:
+        digits = "".join(
+            base.from_base10(rng.randrange(base.base()))
+            for _ in range(whole_number_size + fraction_digits)
+        )
+        # Keep away from the ends of the range so next() and prev() stay inside it.
+        digits = base.from_base10(1) + digits[1:-1] + base.from_base10(1)
+        return lexorank.parse(
+            f"0|{digits[:whole_number_size]}:{digits[whole_number_size:]}",
+            base,
+            whole_number_size=whole_number_size,
+        )
+
+    unique: set[LexoRank] = set()
+    while len(unique) <= size:
+        unique.add(rank(rng.randrange(3)))
+    shallow = sorted(unique)
+    strings = [str(rank_) for rank_ in shallow]
+    pairs = list(zip(shallow, shallow[1:]))
+
+    # Deeply nested fractions, as left behind by many inserts at the same spot.
+    deep = []
+    for _ in range(size):
+        low = rank(24)
+        deep.append((low, low + _unit(low, -24)))
+
+    shuffled = list(shallow)
+    rng.shuffle(shuffled)
+
+    def fresh(ranks: list[LexoRank]) -> list[LexoRank]:
+        # str() is cached per instance, so format uncached copies.
+        return [LexoRank(r.bucket, r.rank, whole_number_size=r.whole_number_size) for r in ranks]
+
+    return [
+        Case(
+            f"{prefix}/parse",
+            lambda: strings,
+            lambda values: [
+                lexorank.parse(value, base, whole_number_size=whole_number_size) for value in values
+            ],
+            len(strings),
+        ),
+        Case(f"{prefix}/str", lambda: fresh(shallow), lambda ranks: [str(r) for r in ranks], size),
+        Case(f"{prefix}/compare", lambda: pairs, lambda ps: [a < b for a, b in ps], size),
+        Case(f"{prefix}/next", lambda: shallow, lambda ranks: [r.next() for r in ranks], size),
+        Case(f"{prefix}/prev", lambda: shallow, lambda ranks: [r.prev() for r in ranks], size),
+        Case(
+            f"{prefix}/between-shallow",
+            lambda: pairs,
+            lambda ps: [lexorank.between(a, b) for a, b in ps],
+            size,
+        ),
+        Case(
+            f"{prefix}/between-deep",
+            lambda: deep,
+            lambda ps: [lexorank.between(a, b) for a, b in ps],
+            size,
+        ),
+        Case(
+            f"{prefix}/middle",
+            lambda: [Bucket.BUCKET_0, Bucket.BUCKET_1, Bucket.BUCKET_2] * (size // 3),
+            # middle() is memoised, so time the computation behind the cache.
+            lambda buckets: [
+                lexorank._middle(bucket, base, DECIMAL_POINT, BUCKET_SEPARATOR, whole_number_size)
+                for bucket in buckets
+            ],
+            size // 3 * 3,
+        ),
+        Case(f"{prefix}/sort", lambda: fresh(shuffled), sorted, len(shuffled)),
+        Case(
+            f"{prefix}/sort-key",
+            lambda: fresh(shuffled),
+            lambda ranks: sorted(ranks, key=LexoRank.sort_key),
+            len(shuffled),
+        ),
+    ]
+
+
+def _readme_cases(size: int) -> list[Case]:
+    # The between() examples from the README.
+    a = lexorank.parse("0|i00000:")
+    b = lexorank.parse("0|i00001:")
+    return [
+        Case(
+            "readme/between",
+            lambda: [(a, b)] * size,
+            lambda ps: [lexorank.between(a_, b_) for a_, b_ in ps],
+            size,
+        ),
+        Case(
+            "readme/between-after",
+            lambda: [(a, None)] * size,
+            lambda ps: [lexorank.between(a_, b_) for a_, b_ in ps],
+            size,
+        ),
+        Case(
+            "readme/between-before",
+            lambda: [(None, a)] * size,
+            lambda ps: [lexorank.between(a_, b_) for a_, b_ in ps],
+            size,
+        ),
+    ]
+
+
+def _unit(template: LexoRank, exponent: int) -> LexoRank:
+    return LexoRank(
+        template.bucket,
+        Decimal(1, exponent, base=template.rank.base),
+        whole_number_size=template.whole_number_size,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from threading import Barrier, Thread
+
+from lexorank.store import SQLiteRankStore
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark SQLiteRankStore under concurrent writers."
+    )
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--operations", type=int, default=500, help="operations per writer")
+    parser.add_argument("--lists", type=int, default=4, help="lists the writers share")
+    parser.add_argument("--batch", type=int, default=10, help="items per move_many")
+    args = parser.parse_args()
+
+    for writers in args.writers:
+        with tempfile.TemporaryDirectory() as directory:
+            database = os.path.join(directory, "ranks.db")
+            seconds = run(database, writers, args.operations, args.lists, args.batch)
+        total = writers * args.operations
+        print(
+            f"writers={writers:<3} {total / seconds:>10,.0f} ops/s ({total} ops in {seconds:.2f}s)"
+        )
+    return 0
+
+
+def run(database: str, writers: int, operations: int, lists: int, batch: int) -> float:
+    store = SQLiteRankStore(database)
+    for list_id in range(lists):
+        for index in range(batch + 1):
+            store.insert_at(str(list_id), f"seed-{index}", index)
+    store.close()
+
+    barrier = Barrier(writers + 1)
+
+    def writer(writer_id: int) -> None:
+        rng = random.Random(writer_id)
+        store = SQLiteRankStore(database)
+        barrier.wait()
+        for operation in range(operations):
+            list_id = str(rng.randrange(lists))
+            ids = [item_id for item_id, _ in store.items(list_id)]
+            choice = rng.random()
+            # A mix of the writes integrators do most: inserts, single moves and block moves.
+            if choice < 0.6:
+                store.insert_at(list_id, f"{writer_id}-{operation}", rng.randrange(len(ids) + 1))
+            elif choice < 0.9:
+                item_id, target_id = rng.sample(ids, 2)
+                store.move_before(list_id, item_id, target_id)
+            else:
+                moved = rng.sample(ids, batch + 1)
+                store.move_many(list_id, moved[1:], after=moved[0])
+        store.close()
+
+    threads = [Thread(target=writer, args=(writer_id,)) for writer_id in range(writers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,9 +6,17 @@ from lexorank.lexorank import (
     WHOLE_NUMBER_SIZE,
     Bucket,
     LexoRank,
+    Towards,
+    add_hook,
     between,
+    disable_parse_cache,
+    enable_parse_cache,
     middle,
     parse,
+    parse_cache_info,
+    remove_hook,
+    skewed_between,
+    spread,
 )
 
 try:
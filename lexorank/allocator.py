@@ -0,0 +1,74 @@
+from threading import Lock, local
+from typing import Callable, Generic, Hashable, Iterator, TypeVar
+
+from lexorank.lexorank import LexoRank, spread
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TailAllocator(Generic[K]):
+    def __init__(
+        self,
+        load_tail: Callable[[K], LexoRank],
+        *,
+        lease_size: int = 64,
+        step: int = 16,
+    ) -> None:
+        if lease_size <= 0:
+            raise ValueError(f"lease_size must be positive: {lease_size}")
+        if step <= 0:
+            raise ValueError(f"step must be positive: {step}")
+        self._load_tail = load_tail
+        self._lease_size = lease_size
+        self._step = step
+        self._lock = Lock()
+        # The last rank leased so far, and a generation that invalidate() bumps.
+        self._tails: dict[K, LexoRank] = {}
+        self._generations: dict[K, int] = {}
+        self._local = local()
+
+    @property
+    def lease_size(self) -> int:
+        return self._lease_size
+
+    @property
+    def step(self) -> int:
+        return self._step
+
+    def allocate(self, key: K) -> LexoRank:
+        # Each thread draws from its own lease without locking; only refills take the lock.
+        leases: dict[K, tuple[int, Iterator[LexoRank]]] | None = getattr(
+            self._local, "leases", None
+        )
+        if leases is None:
+            leases = self._local.leases = {}
+
+        lease = leases.get(key)
+        if lease is not None and lease[0] == self._generations.get(key, 0):
+            rank = next(lease[1], None)
+            if rank is not None:
+                return rank
+
+        generation, ranks = self._lease(key)
+        leases[key] = (generation, ranks)
+        return next(ranks)
+
+    def invalidate(self, key: K) -> None:
+        # Drops the cached tail and every outstanding lease of the list, e.g. after a rebalance
+        # or a write that did not go through this allocator.
+        with self._lock:
+            self._tails.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def _lease(self, key: K) -> tuple[int, Iterator[LexoRank]]:
+        with self._lock:
+            tail = self._tails.get(key)
+            if tail is None:
+                tail = self._load_tail(key)
+
+            last = tail.next(self._step * self._lease_size)
+            if int(last.rank) >= last.rank.base.base() ** last.whole_number_size:
+                raise ValueError(f"no room for {self._lease_size} ranks after {tail}")
+
+            self._tails[key] = last
+            return self._generations.get(key, 0), spread(tail, None, self._lease_size, self._step)
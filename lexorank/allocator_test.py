@@ -0,0 +1,68 @@
+from threading import Thread
+
+import pytest
+
+from lexorank import lexorank
+from lexorank.allocator import TailAllocator
+
+
+def test_allocate():
+    loads = []
+
+    def load_tail(key: str) -> lexorank.LexoRank:
+        loads.append(key)
+        return lexorank.parse("0|i00000:a")
+
+    allocator: TailAllocator[str] = TailAllocator(load_tail, lease_size=2)
+
+    got = [str(allocator.allocate("list")) for _ in range(3)]
+
+    assert got == ["0|i0000g:", "0|i0000w:", "0|i0001c:"]
+    assert loads == ["list"]
+
+
+def test_allocate_threads():
+    allocator: TailAllocator[str] = TailAllocator(
+        lambda _: lexorank.parse("0|000000:"), lease_size=8, step=1
+    )
+    results: list[list[lexorank.LexoRank]] = [[] for _ in range(4)]
+
+    def worker(ranks: list[lexorank.LexoRank]) -> None:
+        for _ in range(100):
+            ranks.append(allocator.allocate("list"))
+
+    threads = [Thread(target=worker, args=(ranks,)) for ranks in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for ranks in results:
+        assert ranks == sorted(ranks)
+    everything = [rank for ranks in results for rank in ranks]
+    assert len(set(everything)) == 400
+
+
+def test_invalidate():
+    tails = {"list": lexorank.parse("0|000000:")}
+    allocator: TailAllocator[str] = TailAllocator(tails.__getitem__, lease_size=4, step=1)
+
+    assert str(allocator.allocate("list")) == "0|000001:"
+    tails["list"] = lexorank.parse("1|000100:")
+    assert str(allocator.allocate("list")) == "0|000002:"
+
+    allocator.invalidate("list")
+    assert str(allocator.allocate("list")) == "1|000101:"
+
+
+def test_allocate_no_room():
+    allocator: TailAllocator[str] = TailAllocator(lambda _: lexorank.parse("0|zzzzzz:"))
+
+    with pytest.raises(ValueError):
+        allocator.allocate("list")
+
+
+@pytest.mark.parametrize("lease_size,step", [(0, 16), (8, 0)])
+def test_invalid_options(lease_size, step):
+    with pytest.raises(ValueError):
+        TailAllocator(lambda _: lexorank.parse("0|000000:"), lease_size=lease_size, step=step)
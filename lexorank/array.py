@@ -0,0 +1,373 @@
+from typing import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from lexorank.base import Base, Base36
+from lexorank.decimal import DECIMAL_POINT
+from lexorank.lexorank import BUCKET_SEPARATOR, WHOLE_NUMBER_SIZE, Bucket
+
+_INVALID = 255
+
+_decode_tables: dict[Base, npt.NDArray[np.uint8]] = {}
+_encode_tables: dict[Base, npt.NDArray[np.uint32]] = {}
+
+
+class RankArray:
+    def __init__(
+        self,
+        buckets: npt.NDArray[np.uint8],
+        digits: npt.NDArray[np.uint8],
+        base: Base = Base36,
+        *,
+        decimal_point: str = DECIMAL_POINT,
+        bucket_separator: str = BUCKET_SEPARATOR,
+        whole_number_size: int = WHOLE_NUMBER_SIZE,
+    ) -> None:
+        if digits.ndim != 2 or digits.shape[0] != buckets.shape[0]:
+            raise ValueError("digits must be a matrix with one row per bucket")
+        if digits.shape[1] < whole_number_size:
+            raise ValueError(f"digits must have at least {whole_number_size} columns")
+        self._buckets = buckets
+        self._digits = digits
+        self._base = base
+        self._decimal_point = decimal_point
+        self._bucket_separator = bucket_separator
+        self._whole_number_size = whole_number_size
+
+    @property
+    def buckets(self) -> npt.NDArray[np.uint8]:
+        return self._buckets
+
+    @property
+    def digits(self) -> npt.NDArray[np.uint8]:
+        return self._digits
+
+    @property
+    def base(self) -> Base:
+        return self._base
+
+    @property
+    def decimal_point(self) -> str:
+        return self._decimal_point
+
+    @property
+    def bucket_separator(self) -> str:
+        return self._bucket_separator
+
+    @property
+    def whole_number_size(self) -> int:
+        return self._whole_number_size
+
+    @property
+    def whole_number(self) -> npt.NDArray[np.uint8]:
+        return self._digits[:, : self._whole_number_size]
+
+    @property
+    def fraction(self) -> npt.NDArray[np.uint8]:
+        return self._digits[:, self._whole_number_size :]
+
+    def __len__(self) -> int:
+        return self._buckets.shape[0]
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} size={len(self)} "
+            f"fraction_size={self.fraction.shape[1]} base={self._base.base()}>"
+        )
+
+
+def parse_array(
+    values: Iterable[str] | npt.ArrayLike,
+    base: Base = Base36,
+    *,
+    decimal_point: str = DECIMAL_POINT,
+    bucket_separator: str = BUCKET_SEPARATOR,
+    whole_number_size: int = WHOLE_NUMBER_SIZE,
+) -> RankArray:
+    codes = _code_points(values)
+    size = 2 + whole_number_size
+    if codes.shape[0] == 0:
+        codes = np.zeros((0, size + 1), dtype=np.uint32)
+    elif codes.shape[1] <= size:
+        raise ValueError(f"invalid lexorank format: {_first(values, np.ones(len(codes), bool))}")
+
+    buckets = codes[:, 0].astype(np.int64) - ord("0")
+    invalid = (buckets < 0) | (buckets >= len(Bucket))
+    invalid |= codes[:, 1] != ord(bucket_separator)
+    invalid |= codes[:, size] != ord(decimal_point)
+
+    # Only the fraction may be short; NUL padding there reads as trailing zeros.
+    table = _decode_table(base)
+    columns = np.concatenate((codes[:, 2:size], codes[:, size + 1 :]), axis=1)
+    digits = table[np.minimum(columns, len(table) - 1)]
+    padding = np.zeros(digits.shape, dtype=bool)
+    padding[:, whole_number_size:] = codes[:, size + 1 :] == 0
+    digits[padding] = 0
+    invalid |= (digits == _INVALID).any(axis=1)
+
+    if invalid.any():
+        raise ValueError(f"invalid lexorank format: {_first(values, invalid)}")
+
+    return RankArray(
+        buckets.astype(np.uint8),
+        digits,
+        base,
+        decimal_point=decimal_point,
+        bucket_separator=bucket_separator,
+        whole_number_size=whole_number_size,
+    )
+
+
+def format_array(ranks: RankArray) -> npt.NDArray[np.str_]:
+    size = 2 + ranks.whole_number_size
+    fraction = ranks.fraction
+    codes = np.empty((len(ranks), size + 1 + fraction.shape[1]), dtype=np.uint32)
+
+    alphabet = _encode_table(ranks.base)
+    codes[:, 0] = ranks.buckets.astype(np.uint32) + ord("0")
+    codes[:, 1] = ord(ranks.bucket_separator)
+    codes[:, 2:size] = alphabet[ranks.whole_number]
+    codes[:, size] = ord(ranks.decimal_point)
+    codes[:, size + 1 :] = alphabet[fraction]
+
+    # Trailing zeros of the fraction become NUL, which numpy strips from unicode strings, so
+    # every row comes out in its canonical form.
+    trailing = np.flip(np.logical_and.accumulate(np.flip(fraction == 0, axis=1), axis=1), axis=1)
+    codes[:, size + 1 :][trailing] = 0
+
+    return np.ascontiguousarray(codes).view(f"U{codes.shape[1]}")[:, 0]
+
+
+def between_many(
+    lefts: Iterable[str | None] | npt.ArrayLike,
+    rights: Iterable[str | None] | npt.ArrayLike,
+    base: Base = Base36,
+    *,
+    decimal_point: str = DECIMAL_POINT,
+    bucket_separator: str = BUCKET_SEPARATOR,
+    whole_number_size: int = WHOLE_NUMBER_SIZE,
+) -> npt.NDArray[np.str_]:
+    left_missing, a = _parse_nullable(
+        lefts,
+        base,
+        decimal_point=decimal_point,
+        bucket_separator=bucket_separator,
+        whole_number_size=whole_number_size,
+    )
+    right_missing, b = _parse_nullable(
+        rights,
+        base,
+        decimal_point=decimal_point,
+        bucket_separator=bucket_separator,
+        whole_number_size=whole_number_size,
+    )
+    if len(a) != len(b):
+        raise ValueError(f"lefts and rights have different lengths: {len(a)}, {len(b)}")
+    if (left_missing & right_missing).any():
+        raise ValueError("a and b cannot be None at the same time")
+
+    # One spare column leaves room for the digit a midpoint may need past both operands.
+    width = max(a.digits.shape[1], b.digits.shape[1]) + 1
+    lower = _widen(a.digits, width)
+    upper = _widen(b.digits, width)
+    radix = base.base()
+
+    digits = np.zeros((len(a), width), dtype=np.uint8)
+    both = ~(left_missing | right_missing)
+    if both.any():
+        if (a.buckets != b.buckets)[both].any():
+            index = np.flatnonzero((a.buckets != b.buckets) & both)[0]
+            raise ValueError(
+                f"{_format_row(a, index)} and {_format_row(b, index)} are in different buckets"
+            )
+        lower, upper = lower[both], upper[both]
+        differ = lower != upper
+        if not differ.any(axis=1).all():
+            index = np.flatnonzero(both)[np.flatnonzero(~differ.any(axis=1))[0]]
+            raise ValueError(
+                f"there is no rank between {_format_row(a, index)} and {_format_row(b, index)}"
+            )
+
+        # Rows compare at their first differing digit; between() does not care about order.
+        first = differ.argmax(axis=1)
+        rows = np.arange(len(lower))
+        swap = (lower[rows, first] > upper[rows, first])[:, None]
+        lower, upper = np.where(swap, upper, lower), np.where(swap, lower, upper)
+        digits[both] = _midpoint(lower, upper, radix, whole_number_size)
+
+    digits[left_missing] = _step(
+        _widen(b.digits, width)[left_missing], -16, radix, whole_number_size
+    )
+    digits[right_missing] = _step(
+        _widen(a.digits, width)[right_missing], 16, radix, whole_number_size
+    )
+
+    return format_array(
+        RankArray(
+            np.where(left_missing, b.buckets, a.buckets),
+            digits,
+            base,
+            decimal_point=decimal_point,
+            bucket_separator=bucket_separator,
+            whole_number_size=whole_number_size,
+        )
+    )
+
+
+def _midpoint(
+    lower: npt.NDArray[np.uint8], upper: npt.NDArray[np.uint8], radix: int, whole_number_size: int
+) -> npt.NDArray[np.uint8]:
+    # Mirrors between(): keep the fewest fractional digits whose floor of lower and ceiling of
+    # upper are at least two apart, then take the midpoint rounded half up at that digit.
+    size, width = lower.shape
+    lower = lower.astype(np.int64)
+    upper = upper.astype(np.int64)
+
+    # The gap between the truncated operands never shrinks once it reaches two, so it is
+    # saturated there to keep it from overflowing.
+    gaps = np.empty((size, width), dtype=np.int64)
+    gap = np.zeros(size, dtype=np.int64)
+    for column in range(width):
+        gap = np.minimum(gap * radix + upper[:, column] - lower[:, column], 2)
+        gaps[:, column] = gap
+    ceiling = np.zeros((size, width), dtype=bool)
+    ceiling[:, :-1] = np.flip(
+        np.logical_or.accumulate(np.flip(upper[:, 1:] != 0, axis=1), axis=1), axis=1
+    )
+    room = gaps + ceiling >= 2
+    room[:, : whole_number_size - 1] = False
+    # Shifted by one for the carry column of the sum below.
+    cut = room.argmax(axis=1) + 1
+
+    total = np.empty((size, width + 1), dtype=np.int64)
+    carry = np.zeros(size, dtype=np.int64)
+    for column in range(width - 1, -1, -1):
+        value = lower[:, column] + upper[:, column] + carry
+        carry = value // radix
+        total[:, column + 1] = value % radix
+    total[:, 0] = carry
+
+    # Rounding the truncated sum S to the nearest half is ceil(S / 2): long division by two,
+    # plus one when the last kept digit leaves a remainder.
+    half = np.empty_like(total)
+    remainders = np.empty_like(total)
+    remainder = np.zeros(size, dtype=np.int64)
+    for column in range(width + 1):
+        value = remainder * radix + total[:, column]
+        half[:, column] = value // 2
+        remainder = value % 2
+        remainders[:, column] = remainder
+
+    columns = np.arange(width + 1)
+    half[columns > cut[:, None]] = 0
+    carry = remainders[np.arange(size), cut]
+    for column in range(width, -1, -1):
+        kept = column <= cut
+        value = half[:, column] + np.where(kept, carry, 0)
+        half[:, column] = value % radix
+        carry = np.where(kept, value // radix, carry)
+
+    # The midpoint lies below upper, so the carry column is always empty.
+    return half[:, 1:].astype(np.uint8)
+
+
+def _step(
+    digits: npt.NDArray[np.uint8], step: int, radix: int, whole_number_size: int
+) -> npt.NDArray[np.uint8]:
+    # Mirrors LexoRank.next(): the fraction is dropped and the step added to the whole number.
+    result = np.zeros_like(digits)
+    carry = np.full(len(digits), step, dtype=np.int64)
+    for column in range(whole_number_size - 1, -1, -1):
+        value = digits[:, column].astype(np.int64) + carry
+        result[:, column] = value % radix
+        carry = value // radix
+    if carry.any():
+        raise ValueError(f"stepping by {step} leaves the whole number range")
+    return result
+
+
+def _parse_nullable(
+    values: Iterable[str | None] | npt.ArrayLike,
+    base: Base,
+    *,
+    decimal_point: str,
+    bucket_separator: str,
+    whole_number_size: int,
+) -> tuple[npt.NDArray[np.bool_], RankArray]:
+    strings = np.asarray(values).reshape(-1)
+    missing = np.zeros(strings.shape, dtype=bool)
+    if strings.dtype.kind == "O":
+        # By identity, as comparing with == would hand None to the __eq__ of every value.
+        missing = np.fromiter((value is None for value in strings), bool, strings.size)
+        # Missing rows parse as a placeholder and are filled in from the other side.
+        placeholder = f"0{bucket_separator}{'0' * whole_number_size}{decimal_point}"
+        strings = np.where(missing, placeholder, strings)
+    return missing, parse_array(
+        strings,
+        base,
+        decimal_point=decimal_point,
+        bucket_separator=bucket_separator,
+        whole_number_size=whole_number_size,
+    )
+
+
+def _widen(digits: npt.NDArray[np.uint8], width: int) -> npt.NDArray[np.uint8]:
+    return np.pad(digits, ((0, 0), (0, width - digits.shape[1])))
+
+
+def _format_row(ranks: RankArray, index: int) -> str:
+    return str(
+        format_array(
+            RankArray(
+                ranks.buckets[index : index + 1],
+                ranks.digits[index : index + 1],
+                ranks.base,
+                decimal_point=ranks.decimal_point,
+                bucket_separator=ranks.bucket_separator,
+                whole_number_size=ranks.whole_number_size,
+            )
+        )[0]
+    )
+
+
+def _code_points(values: Iterable[str] | npt.ArrayLike) -> npt.NDArray[np.uint32]:
+    strings = np.asarray(values)
+    if strings.size == 0:
+        return np.zeros((0, 0), dtype=np.uint32)
+    if strings.dtype.kind == "O":
+        strings = strings.astype(str)
+    if strings.dtype.kind == "S":
+        width = strings.dtype.itemsize
+        return np.ascontiguousarray(strings).view(np.uint8).reshape(-1, width).astype(np.uint32)
+    if strings.dtype.kind != "U":
+        raise ValueError(f"unsupported array type {strings.dtype}")
+    width = strings.dtype.itemsize // 4
+    return (
+        np.ascontiguousarray(strings, dtype=np.dtype(("U", width)))
+        .view(np.uint32)
+        .reshape(-1, width)
+    )
+
+
+def _first(values: Iterable[str] | npt.ArrayLike, invalid: npt.NDArray[np.bool_]) -> object:
+    return np.asarray(values).reshape(-1)[np.flatnonzero(invalid)[0]]
+
+
+def _decode_table(base: Base) -> npt.NDArray[np.uint8]:
+    table = _decode_tables.get(base)
+    if table is None:
+        # Code points outside ASCII are clipped onto DEL, which no base uses.
+        table = np.full(128, _INVALID, dtype=np.uint8)
+        for digit in range(base.base()):
+            table[ord(base.from_base10(digit))] = digit
+        _decode_tables[base] = table
+    return table
+
+
+def _encode_table(base: Base) -> npt.NDArray[np.uint32]:
+    table = _encode_tables.get(base)
+    if table is None:
+        table = np.array([ord(base.from_base10(digit)) for digit in range(base.base())], np.uint32)
+        _encode_tables[base] = table
+    return table
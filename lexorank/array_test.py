@@ -0,0 +1,110 @@
+import pytest
+
+from lexorank import lexorank
+from lexorank.base import Base10, Base36, Base64
+
+np = pytest.importorskip("numpy")
+
+from lexorank import array  # pylint: disable=wrong-import-position
+
+
+@pytest.mark.parametrize(
+    "values,base",
+    [
+        (["0|000000:", "0|i00000:1", "1|zzzzzz:zz1", "2|00ri01:a"], Base36),
+        (["0|000000:", "0|123456:789", "2|999999:1"], Base10),
+        (["0|000000:", "1|Zz^_09:a_", "2|zzzzzz:z"], Base64),
+    ],
+)
+def test_round_trip(values, base):
+    ranks = array.parse_array(values, base)
+
+    assert len(ranks) == len(values)
+    assert list(array.format_array(ranks)) == values
+    for row, value in enumerate(values):
+        rank = lexorank.parse(value, base)
+        assert ranks.buckets[row] == rank.bucket.value
+
+
+def test_parse_array_digits():
+    ranks = array.parse_array(np.array([b"0|00000a:1", b"2|000010:"]))
+
+    assert ranks.buckets.tolist() == [0, 2]
+    assert ranks.whole_number.tolist() == [[0, 0, 0, 0, 0, 10], [0, 0, 0, 0, 1, 0]]
+    assert ranks.fraction.tolist() == [[1], [0]]
+
+
+def test_parse_array_whole_number_size():
+    values = ["0#0001;1", "1#zzzz;"]
+
+    ranks = array.parse_array(values, decimal_point=";", bucket_separator="#", whole_number_size=4)
+
+    assert ranks.whole_number.shape == (2, 4)
+    assert list(array.format_array(ranks)) == values
+
+
+def test_parse_array_empty():
+    ranks = array.parse_array([])
+
+    assert len(ranks) == 0
+    assert len(array.format_array(ranks)) == 0
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["3|000000:", "0|00000:", "0|0000A0:", "0#000000:", "0|000000;1", "0|000000:ü"],
+)
+def test_parse_array_invalid(value):
+    with pytest.raises(ValueError, match="invalid lexorank format"):
+        array.parse_array(["0|000000:", value])
+
+
+@pytest.mark.parametrize(
+    "lefts,rights,base",
+    [
+        (
+            ["0|i00000:", "0|i00001:", None, "1|000001:1"],
+            ["0|i00001:", "0|i00000:", "0|000100:", None],
+            Base36,
+        ),
+        (["0|000000:", "2|000009:5"], ["0|000000:00001", "2|000010:"], Base10),
+        (["0|000000:", "1|zzzzzy:"], ["0|000001:", "1|zzzzzz:"], Base64),
+    ],
+)
+def test_between_many(lefts, rights, base):
+    got = array.between_many(np.array(lefts, dtype=object), np.array(rights, dtype=object), base)
+
+    assert list(got) == [
+        str(
+            lexorank.between(
+                None if a is None else lexorank.parse(a, base),
+                None if b is None else lexorank.parse(b, base),
+            )
+        )
+        for a, b in zip(lefts, rights)
+    ]
+
+
+def test_between_many_ranks():
+    # LexoRank objects mixed with None, as read from an ORM.
+    lefts = [lexorank.parse("0|i00000:"), None, lexorank.parse("0|i0000g:")]
+    rights = [lexorank.parse("0|i00001:"), lexorank.parse("0|i00000:"), None]
+
+    got = array.between_many(lefts, rights)
+
+    assert list(got) == [str(lexorank.between(a, b)) for a, b in zip(lefts, rights)]
+
+
+@pytest.mark.parametrize(
+    "lefts,rights,message",
+    [
+        (["0|i00000:"], ["0|i00000:"], "there is no rank between"),
+        (["0|i00000:"], ["1|i00001:"], "are in different buckets"),
+        ([None], [None], "cannot be None at the same time"),
+        (["0|i00000:"], [], "different lengths"),
+        ([None], ["0|000001:"], "leaves the whole number range"),
+    ],
+)
+def test_between_many_invalid(lefts, rights, message):
+    with pytest.raises(ValueError, match=message):
+        array.between_many(np.array(lefts, dtype=object), np.array(rights, dtype=object))
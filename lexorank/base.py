@@ -1,3 +1,6 @@
+import base64
+import binascii
+import re
 from typing import Protocol
 
 
@@ -24,6 +27,16 @@ class Base10:
     def from_base10(digit: int) -> str:
         return str(digit)
 
+    @staticmethod
+    def decode(value: str) -> int:
+        if _base10_pattern.fullmatch(value) is None:
+            raise ValueError(f"invalid base10 number: {value}")
+        return int(value) if value else 0
+
+    @staticmethod
+    def encode(value: int, width: int = 0) -> str:
+        return str(value).zfill(width)
+
     @staticmethod
     def base() -> int:
         return 10
@@ -38,6 +51,23 @@ class Base36:
     def from_base10(digit: int) -> str:
         return base10ToBase36[digit]
 
+    @staticmethod
+    def decode(value: str) -> int:
+        if _base36_pattern.fullmatch(value) is None:
+            raise ValueError(f"invalid base36 number: {value}")
+        return int(value, 36) if value else 0
+
+    @staticmethod
+    def encode(value: int, width: int = 0) -> str:
+        # int() parses base 36 natively but nothing formats it, so emit two digits per step.
+        chunks = []
+        while value >= 36**2:
+            value, pair = divmod(value, 36**2)
+            chunks.append(_base36_pairs[pair])
+        chunks.append(_base36_pairs[value])
+        chunks.reverse()
+        return _zfill("".join(chunks), width)
+
     @staticmethod
     def base() -> int:
         return 36
@@ -52,6 +82,24 @@ class Base64:
     def from_base10(digit: int) -> str:
         return base10ToBase64[digit]
 
+    @staticmethod
+    def decode(value: str) -> int:
+        # Base64 digits are 6 bits wide, so translating the alphabet onto the standard one lets
+        # binascii do the conversion. Four digits pack into exactly three bytes.
+        try:
+            data = value.encode("ascii").translate(_base64_to_standard)
+            data = b"A" * (-len(data) % 4) + data
+            return int.from_bytes(base64.b64decode(data, validate=True), "big")
+        except (binascii.Error, UnicodeEncodeError):
+            raise ValueError(f"invalid base64 number: {value}") from None
+
+    @staticmethod
+    def encode(value: int, width: int = 0) -> str:
+        size = -(-value.bit_length() // 6)
+        size += -size % 4
+        data = base64.b64encode(value.to_bytes(size // 4 * 3, "big"))
+        return _zfill(data.translate(_standard_to_base64).decode("ascii"), width)
+
     @staticmethod
     def base() -> int:
         return 64
@@ -166,3 +214,51 @@ base64ToBase10 = {
 }
 
 base10ToBase64 = {v: k for k, v in base64ToBase10.items()}
+
+_base10_pattern = re.compile("[0-9]*")
+
+_base36_pattern = re.compile("[0-9a-z]*")
+
+_base36_pairs = [base10ToBase36[i // 36] + base10ToBase36[i % 36] for i in range(36**2)]
+
+_base64_alphabet = "".join(base10ToBase64[i] for i in range(64)).encode("ascii")
+_standard_alphabet = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+# "+", "/" and "=" are valid for binascii but not for Base64, so they are mapped to "*" which
+# b64decode rejects.
+_base64_to_standard = bytes.maketrans(_base64_alphabet + b"+/=", _standard_alphabet + b"***")
+_standard_to_base64 = bytes.maketrans(_standard_alphabet, _base64_alphabet)
+
+
+def decode(base: Base, value: str) -> int:
+    # Bases may provide a whole-string decode(); others are converted digit by digit.
+    codec = getattr(base, "decode", None)
+    if codec is not None:
+        return codec(value)
+
+    radix = base.base()
+    result = 0
+    try:
+        for digit in value:
+            result = result * radix + base.to_base10(digit)
+    except (KeyError, ValueError):
+        raise ValueError(f"invalid base{radix} number: {value}") from None
+    return result
+
+
+def encode(base: Base, value: int, width: int = 0) -> str:
+    codec = getattr(base, "encode", None)
+    if codec is not None:
+        return codec(value, width)
+
+    radix = base.base()
+    digits = []
+    while value > 0:
+        value, digit = divmod(value, radix)
+        digits.append(base.from_base10(digit))
+    digits.reverse()
+    return _zfill("".join(digits), width)
+
+
+def _zfill(value: str, width: int) -> str:
+    return (value.lstrip("0") or "0").zfill(width)
@@ -0,0 +1,91 @@
+import pytest
+
+from lexorank.base import Base10, Base36, Base64, decode, encode
+from lexorank.lexorank import parse
+
+
+def test_decode():
+    cases = [
+        {"in": ("", Base10), "want": 0},
+        {"in": ("0123", Base10), "want": 123},
+        {"in": ("ri", Base36), "want": 27 * 36 + 18},
+        {"in": ("r^i", Base64), "want": 55 * 64**2 + 36 * 64 + 46},
+        {"in": ("_0", Base64), "want": 37 * 64},
+        {"in": ("zzzzzz", Base36), "want": 36**6 - 1},
+    ]
+
+    for c in cases:
+        assert c["in"][1].decode(c["in"][0]) == c["want"]
+
+
+def test_decode_invalid():
+    cases = [
+        ("1a", Base10),
+        ("+1", Base10),
+        ("1_0", Base10),
+        ("A", Base36),
+        ("-1", Base36),
+        ("a+", Base64),
+        ("a/", Base64),
+        ("a=", Base64),
+        ("a b", Base64),
+        ("é", Base64),
+    ]
+
+    for c in cases:
+        with pytest.raises(ValueError, match=f"invalid base{c[1].base()} number"):
+            c[1].decode(c[0])
+
+
+def test_encode():
+    cases = [
+        {"in": (0, 0, Base10), "want": "0"},
+        {"in": (123, 6, Base10), "want": "000123"},
+        {"in": (27 * 36 + 18, 0, Base36), "want": "ri"},
+        {"in": (27 * 36 + 18, 3, Base36), "want": "0ri"},
+        {"in": (55 * 64**2 + 36 * 64 + 46, 0, Base64), "want": "r^i"},
+        {"in": (64**4, 0, Base64), "want": "10000"},
+    ]
+
+    for c in cases:
+        value, width, base = c["in"]
+        assert base.encode(value, width) == c["want"]
+
+
+def test_round_trip():
+    for base in (Base10, Base36, Base64):
+        for value in (
+            1,
+            base.base() - 1,
+            base.base(),
+            2**64 + 1,
+            123123541345346245634523463456456,
+        ):
+            assert base.decode(base.encode(value)) == value
+
+
+class Base2:
+    # A codec that only converts single digits.
+    @staticmethod
+    def to_base10(digit: str) -> int:
+        return {"0": 0, "1": 1}[digit]
+
+    @staticmethod
+    def from_base10(digit: int) -> str:
+        return "01"[digit]
+
+    @staticmethod
+    def base() -> int:
+        return 2
+
+
+def test_digit_fallback():
+    assert decode(Base2, "1011") == 11
+    assert encode(Base2, 11, 6) == "001011"
+    assert encode(Base2, 0) == "0"
+    with pytest.raises(ValueError):
+        decode(Base2, "102")
+
+    rank = parse("0|000101:1", Base2)
+    assert str(rank) == "0|000101:1"
+    assert str(rank.next()) == "0|010101:"
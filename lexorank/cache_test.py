@@ -0,0 +1,33 @@
+import pytest
+
+from lexorank.cache import CacheInfo, LRUCache
+
+
+def test_lru_cache():
+    cache: LRUCache[str, int] = LRUCache(2)
+
+    assert cache.get("a") is None
+    assert cache.put("a", 1) == 1
+    assert cache.put("b", 2) == 2
+    assert cache.get("a") == 1
+    assert cache.put("c", 3) == 3
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    assert cache.info() == CacheInfo(hits=2, misses=2, evictions=1, maxsize=2, currsize=2)
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=2, currsize=0)
+
+
+def test_lru_cache_keeps_first_value():
+    cache: LRUCache[str, list[int]] = LRUCache(2)
+    first = [1]
+
+    assert cache.put("a", first) is first
+    assert cache.put("a", [1]) is first
+
+
+def test_lru_cache_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(0)
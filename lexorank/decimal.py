@@ -1,49 +1,77 @@
+import sys
+from fractions import Fraction
+from math import gcd
+
 from typing_extensions import Self
 
 from lexorank import integer
-from lexorank.base import Base, Base36
-from lexorank.integer import Integer, Sign
+from lexorank.base import Base, Base36, encode
+from lexorank.integer import Integer
 
 DECIMAL_POINT = ":"
 
 
 class Decimal:
+    __slots__ = ("_value", "_exponent", "_base", "_decimal_point", "_str")
+
     def __init__(
-        self, significant_figures: Integer, exponent: int, *, decimal_point: str = DECIMAL_POINT
+        self,
+        significant_figures: Integer | int,
+        exponent: int,
+        *,
+        base: Base = Base36,
+        decimal_point: str = DECIMAL_POINT,
     ) -> None:
-        self._integer, self._exponent = self._rstrip(significant_figures, exponent)
+        if isinstance(significant_figures, Integer):
+            base = significant_figures.base
+            significant_figures = int(significant_figures)
+        radix = base.base()
+        if significant_figures % radix:
+            self._value = significant_figures
+            self._exponent = exponent
+        else:
+            self._value, self._exponent = self._rstrip(significant_figures, exponent, radix)
+        self._base = base
         self._decimal_point = decimal_point
+        self._str: str | None = None
 
     @property
     def base(self) -> Base:
-        return self._integer.base
+        return self._base
 
     @property
     def decimal_point(self) -> str:
         return self._decimal_point
 
+    @property
+    def significand(self) -> int:
+        return self._value
+
+    @property
+    def exponent(self) -> int:
+        return self._exponent
+
     def __neg__(self) -> Self:
-        return self.__class__(-self._integer, self._exponent)
+        return self._new(-self._value, self._exponent)
 
     def __abs__(self) -> Self:
-        return self.__class__(abs(self._integer), self._exponent)
+        return self._new(abs(self._value), self._exponent)
 
     def __add__(self, other: object) -> Self:
         other = self._type_guard(other)
 
         if self._exponent == other._exponent:
-            return self.__class__(self._integer + other._integer, self._exponent)
-
-        lv: Decimal = self
-        rv = other
-        if self._exponent < other._exponent:
-            lv, rv = rv, lv
-
-        diff = lv._exponent - rv._exponent
-        lv_integer = lv._integer << diff
-        lv_exponent = lv._exponent - diff
-
-        return self.__class__(lv_integer + rv._integer, lv_exponent)
+            return self._new(self._value + other._value, self._exponent)
+        if self._exponent > other._exponent:
+            return self._new(
+                self._value * self._base.base() ** (self._exponent - other._exponent)
+                + other._value,
+                other._exponent,
+            )
+        return self._new(
+            self._value + other._value * self._base.base() ** (other._exponent - self._exponent),
+            self._exponent,
+        )
 
     def __sub__(self, other: object) -> Self:
         other = self._type_guard(other)
@@ -53,80 +81,137 @@ class Decimal:
     def __mul__(self, other: object) -> Self:
         other = self._type_guard(other)
 
-        return self.__class__(self._integer * other._integer, self._exponent + other._exponent)
+        return self._new(self._value * other._value, self._exponent + other._exponent)
+
+    def __truediv__(self, other: object) -> Self:
+        if not isinstance(other, int) or isinstance(other, bool):
+            raise ValueError(f"unsupported operand type(s) {type(other)}")
+        if other == 0:
+            raise ZeroDivisionError("division by zero")
+
+        base = self._base.base()
+        value = self._value
+        exponent = self._exponent
+
+        # Append digits until the divisor only has prime factors that were already in the value.
+        divisor = abs(other) // gcd(value, other)
+        while divisor != 1:
+            factor = gcd(divisor, base)
+            if factor == 1:
+                raise ValueError(f"{self} / {other} has no finite expansion in base {base}")
+            divisor //= factor
+            value *= base
+            exponent -= 1
+
+        return self._new(value // other, exponent)
+
+    def halve(self) -> Self:
+        return self / 2
 
     def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (Decimal, int, str, float, Integer)):
+            return NotImplemented
         other = self._type_guard(other)
 
-        return self._integer == other._integer and self._exponent == other._exponent
+        return self._value == other._value and self._exponent == other._exponent
 
     def __gt__(self, other: object) -> bool:
-        other = self._type_guard(other)
-
-        if self._exponent == other._exponent:
-            return self._integer > other._integer
-        if self._exponent > other._exponent:
-            return self._integer << (self._exponent - other._exponent) > other._integer
-        return self._integer > other._integer << (other._exponent - self._exponent)
+        return self._compare(self._type_guard(other)) > 0
 
     def __ge__(self, other: object):
-        return self.__gt__(other) or self.__eq__(other)
+        return self._compare(self._type_guard(other)) >= 0
 
     def __lt__(self, other: object):
-        return not self.__ge__(other)
+        return self._compare(self._type_guard(other)) < 0
 
     def __le__(self, other: object):
-        return not self.__gt__(other)
+        return self._compare(self._type_guard(other)) <= 0
 
     def whole_number(self) -> Integer:
-        if self._exponent < 0:
-            return self._integer >> abs(self._exponent)
-        return self._integer << self._exponent
+        return Integer(self._whole_number(), self._base)
 
     def decimal(self) -> "Decimal":
-        return self - self.whole_number()
+        return self - self._whole_number()
+
+    def __hash__(self) -> int:
+        # Hash the exact value so that equal ints, floats and fractions hash alike. This is how
+        # Python hashes rationals, without building a Fraction first.
+        modulus = sys.hash_info.modulus
+        result = abs(self._value) * pow(self._base.base(), self._exponent, modulus) % modulus
+        if self._value < 0:
+            result = -result
+        return -2 if result == -1 else result
 
     def __str__(self) -> str:
-        sign = "" if self._integer.sign == Sign.POSITIVE else "-"
-        intger_str = str(abs(self._integer))
-        if self._exponent < 0:
-            if len(intger_str) <= abs(self._exponent):
-                intger_str = "0" * (abs(self._exponent) - len(intger_str) + 1) + intger_str
-            return (
-                sign
-                + intger_str[: self._exponent]
-                + self._decimal_point
-                + intger_str[self._exponent :]
-            )
-        if self._exponent > 0:
-            return sign + intger_str + "0" * self._exponent + self._decimal_point
-        return sign + intger_str + self._decimal_point
+        if self._str is None:
+            self._str = self._format()
+        return self._str
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} value={self}, base={self.base.base()}>"
 
     def __int__(self) -> int:
-        return int(self.whole_number())
+        return self._whole_number()
 
     def __float__(self) -> float:
-        return float(int(self._integer) * (self.base.base() ** self._exponent))
+        if self._exponent < 0:
+            return self._value / self._base.base() ** -self._exponent
+        return float(self._value * self._base.base() ** self._exponent)
 
     def __len__(self) -> int:
-        return len(self._integer)
+        if self._value == 0:
+            return 0
+        return len(encode(self._base, abs(self._value)))
+
+    def as_integer_ratio(self) -> tuple[int, int]:
+        if self._exponent >= 0:
+            return self._value * self._base.base() ** self._exponent, 1
+        denominator = self._base.base() ** -self._exponent
+        divisor = gcd(self._value, denominator)
+        return self._value // divisor, denominator // divisor
+
+    def _new(self, value: int, exponent: int) -> Self:
+        return self.__class__(value, exponent, base=self._base, decimal_point=self._decimal_point)
+
+    def _format(self) -> str:
+        sign = "-" if self._value < 0 else ""
+        if self._exponent < 0:
+            digits = encode(self._base, abs(self._value), 1 - self._exponent)
+            return sign + digits[: self._exponent] + self._decimal_point + digits[self._exponent :]
+        digits = encode(self._base, abs(self._value))
+        if self._exponent > 0:
+            return sign + digits + "0" * self._exponent + self._decimal_point
+        return sign + digits + self._decimal_point
+
+    def _whole_number(self) -> int:
+        if self._exponent >= 0:
+            return self._value * self._base.base() ** self._exponent
+        # Drop the fractional digits, truncating towards zero.
+        whole = abs(self._value) // self._base.base() ** -self._exponent
+        return -whole if self._value < 0 else whole
+
+    def _compare(self, other: "Decimal") -> int:
+        lv = self._value
+        rv = other._value
+        if self._exponent > other._exponent:
+            lv *= self._base.base() ** (self._exponent - other._exponent)
+        elif self._exponent < other._exponent:
+            rv *= self._base.base() ** (other._exponent - self._exponent)
+        return (lv > rv) - (lv < rv)
 
     @staticmethod
-    def _rstrip(value: Integer, exponent: int) -> tuple[Integer, int]:
-        index = 0
-        for digit in reversed(value.digits):
-            if digit != 0:
-                break
-            index += 1
+    def _rstrip(value: int, exponent: int, base: int) -> tuple[int, int]:
+        if value == 0:
+            return 0, 0
 
-        return value >> index, exponent + index
+        while value % base == 0:
+            value //= base
+            exponent += 1
+        return value, exponent
 
     def _type_guard(self, other: object) -> "Decimal":
         if isinstance(other, (int, str, float, Integer)):
-            return parse(other, self.base)
+            return parse(other, self.base, decimal_point=self._decimal_point)
         if isinstance(other, Decimal):
             return other
         raise ValueError(f"unsupported operand type(s) {type(other)}")
@@ -173,3 +258,23 @@ def parse(
     integer_str = value[:index] + value[index + 1 :]
     exponent = index - len(value) + 1
     return Decimal(integer.parse(integer_str, base), exponent, decimal_point=decimal_point)
+
+
+def from_fraction(
+    value: Fraction,
+    base: Base = Base36,
+    *,
+    decimal_point: str = DECIMAL_POINT,
+    digits: int | None = None,
+) -> Decimal:
+    if digits is not None:
+        # Round towards negative infinity at the requested number of fractional digits.
+        scale = base.base() ** digits
+        return Decimal(
+            value.numerator * scale // value.denominator,
+            -digits,
+            base=base,
+            decimal_point=decimal_point,
+        )
+
+    return Decimal(value.numerator, 0, base=base, decimal_point=decimal_point) / value.denominator
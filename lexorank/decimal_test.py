@@ -1,3 +1,7 @@
+from fractions import Fraction
+
+import pytest
+
 from lexorank import decimal, integer
 from lexorank.base import Base10, Base36, Base64
 from lexorank.decimal import Decimal
@@ -52,6 +56,54 @@ def test_mul():
         assert a * b == decimal.parse(*c["want"])
 
 
+def test_div():
+    cases = [
+        {"in": (("1:5", Base10), 2), "want": ("0:75", Base10)},
+        {"in": (("1:5", Base10), 3), "want": ("0:5", Base10)},
+        {"in": (("1", Base36), 3), "want": ("0:c", Base36)},
+        {"in": (("1", Base36), -8), "want": ("-0:4i", Base36)},
+        {"in": (("W", Base64), 2), "want": ("G", Base64)},
+    ]
+
+    for c in cases:
+        a = decimal.parse(*c["in"][0])
+        assert a / c["in"][1] == decimal.parse(*c["want"])
+
+    with pytest.raises(ValueError):
+        decimal.parse("1", Base10) / 3
+    with pytest.raises(ZeroDivisionError):
+        decimal.parse("1", Base10) / 0
+
+
+def test_halve():
+    cases = [
+        {"in": ("1000000", Base36), "want": ("i00000", Base36)},
+        {"in": ("0:1", Base36), "want": ("0:0i", Base36)},
+        {"in": ("-3", Base10), "want": ("-1:5", Base10)},
+    ]
+
+    for c in cases:
+        assert decimal.parse(*c["in"]).halve() == decimal.parse(*c["want"])
+
+
+def test_from_fraction():
+    cases = [
+        {"in": (Fraction(1, 2), Base10, None), "want": "0:5"},
+        {"in": (Fraction(1, 3), Base36, None), "want": "0:c"},
+        {"in": (Fraction(1, 3), Base10, 3), "want": "0:333"},
+        {"in": (Fraction(-1, 3), Base10, 2), "want": "-0:34"},
+        {"in": (Fraction(7, 2), Base10, 3), "want": "3:5"},
+    ]
+
+    for c in cases:
+        got = decimal.from_fraction(c["in"][0], c["in"][1], digits=c["in"][2])
+        assert str(got) == c["want"]
+        assert Fraction(*got.as_integer_ratio()) <= c["in"][0]
+
+    with pytest.raises(ValueError):
+        decimal.from_fraction(Fraction(1, 3), Base10)
+
+
 def test_eq():
     cases = [
         {"in": (0, 0)},
@@ -98,6 +150,55 @@ def test_gt():
         assert (a > b) == (c["in"][0] > c["in"][1])
 
 
+def test_compare():
+    cases = [
+        {"in": (("1:5", Base10), ("1:50", Base10)), "want": (False, True, False)},
+        {"in": (("1:5", Base10), ("1:51", Base10)), "want": (True, False, False)},
+        {"in": (("100", Base10), ("99:99", Base10)), "want": (False, False, True)},
+        {"in": (("-0:i", Base36), ("0:1", Base36)), "want": (True, False, False)},
+    ]
+
+    for c in cases:
+        a = decimal.parse(*c["in"][0])
+        b = decimal.parse(*c["in"][1])
+        assert (a < b, a == b, a > b) == c["want"]
+        assert (a <= b, a >= b) == (a < b or a == b, a > b or a == b)
+
+
+def test_normalize():
+    cases = [
+        {"in": (1200, -3, Base10), "want": ("1:2", 2)},
+        {"in": (36**3, 0, Base36), "want": ("1000:", 1)},
+        {"in": (0, -5, Base64), "want": ("0:", 0)},
+    ]
+
+    for c in cases:
+        got = Decimal(c["in"][0], c["in"][1], base=c["in"][2])
+        assert (str(got), len(got)) == c["want"]
+
+
+def test_hash():
+    cases = [
+        {"in": ("0:i", Base36), "want": 0.5},
+        {"in": ("12:5", Base10), "want": Fraction(25, 2)},
+        {"in": ("a", Base36), "want": 10},
+        {"in": ("1:000", Base64), "want": 1},
+        {"in": ("-0:i", Base36), "want": -0.5},
+        {"in": ("-1", Base10), "want": -1},
+        {"in": ("0:0001", Base10), "want": Fraction(1, 10000)},
+    ]
+
+    for c in cases:
+        assert hash(decimal.parse(*c["in"])) == hash(c["want"])
+
+
+def test_eq_foreign():
+    got = decimal.parse("0:i")
+    assert got != None  # noqa: E711
+    assert got != object()
+    assert got == 0.5
+
+
 def test_whole_number():
     cases = [
         {"in": ("12345", Base10, -3), "want": "12"},
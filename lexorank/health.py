@@ -0,0 +1,207 @@
+import heapq
+from collections import Counter, deque
+from fractions import Fraction
+from itertools import count as counter
+from typing import Any, Iterable, NamedTuple
+
+from lexorank.base import Base, Base36
+from lexorank.decimal import DECIMAL_POINT
+from lexorank.lexorank import BUCKET_SEPARATOR, WHOLE_NUMBER_SIZE, Bucket, LexoRank, parse
+from lexorank.rebalance import Item, rank_of
+
+
+class BucketHealth(NamedTuple):
+    rows: int
+    fraction_sizes: dict[int, int]
+    first: LexoRank
+    last: LexoRank
+    headroom_below: int
+    headroom_above: int
+
+
+class Gap(NamedTuple):
+    size: Fraction
+    lower: Any
+    upper: Any
+
+
+class HotZone(NamedTuple):
+    start: Any
+    end: Any
+    rows: int
+    long_ranks: int
+
+
+class HealthReport(NamedTuple):
+    rows: int
+    buckets: dict[Bucket, BucketHealth]
+    longest: list[Any]
+    smallest_gaps: list[Gap]
+    hot_zones: list[HotZone]
+
+
+class HealthAnalyzer:
+    def __init__(
+        self, *, top: int = 10, long_digits: int = 4, window: int = 100, min_long: int = 50
+    ) -> None:
+        if top <= 0:
+            raise ValueError(f"top must be positive: {top}")
+        if not 0 < min_long <= window:
+            raise ValueError(f"min_long must be between 1 and window: {min_long}")
+        self._top = top
+        self._long_digits = long_digits
+        self._window = window
+        self._min_long = min_long
+
+        self._rows = 0
+        self._buckets: dict[Bucket, list[Any]] = {}
+        self._sequence = counter()
+        # Heaps keep the current top entries, with the weakest one at the root.
+        self._longest: list[tuple[int, int, Any]] = []
+        self._gaps: list[tuple[Fraction, int, Any, Any]] = []
+        self._zones: list[tuple[int, int, HotZone]] = []
+
+        self._previous: Any = None
+        self._recent: deque[tuple[Any, bool]] = deque(maxlen=window)
+        self._recent_long = 0
+        self._zone: list[Any] | None = None
+
+    def add(self, item: Item) -> None:
+        rank = rank_of(item)
+        if self._previous is not None:
+            previous = rank_of(self._previous)
+            if rank.bucket == previous.bucket:
+                if rank <= previous:
+                    raise ValueError(f"ranks are not in ascending order: {previous}, {rank}")
+                self._add_gap(self._previous, item)
+            elif rank.bucket < previous.bucket:
+                raise ValueError(f"ranks are not in ascending order: {previous}, {rank}")
+            else:
+                self._close_zone()
+                self._recent.clear()
+                self._recent_long = 0
+
+        self._rows += 1
+        fraction_size = max(-rank.rank.exponent, 0)
+        self._add_to_bucket(rank, fraction_size)
+
+        sequence = next(self._sequence)
+        if len(self._longest) < self._top:
+            heapq.heappush(self._longest, (fraction_size, sequence, item))
+        elif fraction_size > self._longest[0][0]:
+            heapq.heapreplace(self._longest, (fraction_size, sequence, item))
+
+        self._add_to_window(item, fraction_size > self._long_digits)
+        self._previous = item
+
+    def report(self) -> HealthReport:
+        zones = list(self._zones)
+        if self._zone is not None:
+            zones.append((self._zone[3], 0, self._current_zone()))
+        return HealthReport(
+            self._rows,
+            {
+                bucket: BucketHealth(
+                    state[0],
+                    dict(sorted(state[1].items())),
+                    state[2],
+                    state[3],
+                    int(state[2].rank),
+                    _capacity(state[3]) - 1 - int(state[3].rank),
+                )
+                for bucket, state in sorted(self._buckets.items())
+            },
+            [item for _, _, item in sorted(self._longest, key=lambda entry: -entry[0])],
+            [
+                Gap(-size, lower, upper)
+                for size, _, lower, upper in sorted(self._gaps, key=lambda entry: -entry[0])
+            ],
+            [zone for _, _, zone in sorted(zones, key=lambda entry: -entry[0])[: self._top]],
+        )
+
+    def _add_to_bucket(self, rank: LexoRank, fraction_size: int) -> None:
+        state = self._buckets.get(rank.bucket)
+        if state is None:
+            # [rows, fraction sizes, first rank, last rank]
+            state = self._buckets[rank.bucket] = [0, Counter(), rank, rank]
+        state[0] += 1
+        state[1][fraction_size] += 1
+        state[3] = rank
+
+    def _add_gap(self, lower: Item, upper: Item) -> None:
+        # Negated, so that the root of the heap is the widest of the smallest gaps.
+        size = Fraction(*rank_of(lower).rank.as_integer_ratio()) - Fraction(
+            *rank_of(upper).rank.as_integer_ratio()
+        )
+        entry = (size, next(self._sequence), lower, upper)
+        if len(self._gaps) < self._top:
+            heapq.heappush(self._gaps, entry)
+        elif size > self._gaps[0][0]:
+            heapq.heapreplace(self._gaps, entry)
+
+    def _add_to_window(self, item: Item, long: bool) -> None:
+        if len(self._recent) == self._window and self._recent[0][1]:
+            self._recent_long -= 1
+        self._recent.append((item, long))
+        self._recent_long += long
+
+        if self._zone is not None:
+            self._zone[1] = item
+            self._zone[2] += 1
+            self._zone[3] += long
+            if self._recent_long < self._min_long:
+                self._close_zone()
+        elif self._recent_long >= self._min_long:
+            # [start, end, rows, long ranks]
+            self._zone = [self._recent[0][0], item, len(self._recent), self._recent_long]
+
+    def _current_zone(self) -> HotZone:
+        assert self._zone is not None
+        return HotZone(*self._zone)
+
+    def _close_zone(self) -> None:
+        if self._zone is None:
+            return
+        entry = (self._zone[3], next(self._sequence), self._current_zone())
+        if len(self._zones) < self._top:
+            heapq.heappush(self._zones, entry)
+        elif entry[0] > self._zones[0][0]:
+            heapq.heapreplace(self._zones, entry)
+        self._zone = None
+
+
+def analyze(items: Iterable[Item], **options: Any) -> HealthReport:
+    analyzer = HealthAnalyzer(**options)
+    for item in items:
+        analyzer.add(item)
+    return analyzer.report()
+
+
+def analyze_file(
+    path: str,
+    base: Base = Base36,
+    *,
+    decimal_point: str = DECIMAL_POINT,
+    bucket_separator: str = BUCKET_SEPARATOR,
+    whole_number_size: int = WHOLE_NUMBER_SIZE,
+    **options: Any,
+) -> HealthReport:
+    analyzer = HealthAnalyzer(**options)
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                analyzer.add(
+                    parse(
+                        line,
+                        base,
+                        decimal_point=decimal_point,
+                        bucket_separator=bucket_separator,
+                        whole_number_size=whole_number_size,
+                    )
+                )
+    return analyzer.report()
+
+
+def _capacity(rank: LexoRank) -> int:
+    return rank.rank.base.base() ** rank.whole_number_size
@@ -0,0 +1,59 @@
+from fractions import Fraction
+
+import pytest
+
+from lexorank import health, lexorank
+from lexorank.lexorank import Bucket
+
+
+def test_analyze():
+    values = [
+        "0|000010:",
+        "0|000020:1",
+        "0|000020:11",
+        "0|000020:111",
+        "0|000030:",
+        "1|zzzzzy:",
+    ]
+    ranks = [lexorank.parse(value) for value in values]
+
+    report = health.analyze(ranks, top=2, long_digits=1, window=3, min_long=2)
+
+    assert report.rows == 6
+    assert report.buckets[Bucket.BUCKET_0] == health.BucketHealth(
+        5, {0: 2, 1: 1, 2: 1, 3: 1}, ranks[0], ranks[4], 36, 36**6 - 1 - 3 * 36
+    )
+    assert report.buckets[Bucket.BUCKET_1].headroom_above == 1
+    assert report.longest == [ranks[3], ranks[2]]
+    assert report.smallest_gaps == [
+        health.Gap(Fraction(1, 36**3), ranks[2], ranks[3]),
+        health.Gap(Fraction(1, 36**2), ranks[1], ranks[2]),
+    ]
+    assert report.hot_zones == [health.HotZone(ranks[1], ranks[4], 4, 2)]
+
+
+def test_analyze_pairs():
+    items = [(i, lexorank.parse(f"0|00000{i}:1")) for i in range(3)]
+
+    report = health.analyze(items, top=1)
+
+    assert report.longest == [items[0]]
+    assert report.smallest_gaps == [health.Gap(Fraction(1), items[0], items[1])]
+
+
+def test_analyze_file(tmp_path):
+    path = tmp_path / "ranks.txt"
+    path.write_text("0|i00000:\n0|i00000:i\n\n0|i00001:\n")
+
+    report = health.analyze_file(str(path))
+
+    assert report.rows == 3
+    assert report.buckets[Bucket.BUCKET_0].fraction_sizes == {0: 2, 1: 1}
+
+
+@pytest.mark.parametrize(
+    "values", [["0|000002:", "0|000001:"], ["1|000001:", "0|000002:"], ["0|000001:"] * 2]
+)
+def test_analyze_unordered(values):
+    with pytest.raises(ValueError):
+        health.analyze(lexorank.parse(value) for value in values)
@@ -0,0 +1,102 @@
+from bisect import bisect_left
+from collections import Counter
+from threading import Lock
+from typing import Callable, NamedTuple
+
+# Upper bounds of the latency buckets in seconds; slower events land in a final overflow bucket.
+LATENCY_BOUNDS = (
+    1e-6,
+    2e-6,
+    5e-6,
+    1e-5,
+    2e-5,
+    5e-5,
+    1e-4,
+    2e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    1e-1,
+    1.0,
+)
+
+
+class Event(NamedTuple):
+    operation: str
+    seconds: float
+    fraction_size: int
+
+
+Hook = Callable[[Event], None]
+
+
+class Histogram(NamedTuple):
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise ValueError(f"q must be between 0 and 1: {q}")
+        total = sum(self.counts)
+        if total == 0:
+            return 0.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= q * total:
+                return self.bounds[index] if index < len(self.bounds) else float("inf")
+        return float("inf")
+
+
+class OperationStats(NamedTuple):
+    calls: int
+    seconds: float
+    latency: Histogram
+    fraction_sizes: dict[int, int]
+
+    @property
+    def max_fraction_size(self) -> int:
+        return max(self.fraction_sizes, default=0)
+
+
+class HistogramAggregator:
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BOUNDS) -> None:
+        if list(bounds) != sorted(bounds):
+            raise ValueError("bounds must be in ascending order")
+        self._bounds = tuple(bounds)
+        self._lock = Lock()
+        self._counts: dict[str, list[int]] = {}
+        self._seconds: dict[str, float] = {}
+        self._fraction_sizes: dict[str, Counter[int]] = {}
+
+    def __call__(self, event: Event) -> None:
+        index = bisect_left(self._bounds, event.seconds)
+        with self._lock:
+            counts = self._counts.get(event.operation)
+            if counts is None:
+                counts = self._counts[event.operation] = [0] * (len(self._bounds) + 1)
+                self._seconds[event.operation] = 0.0
+                self._fraction_sizes[event.operation] = Counter()
+            counts[index] += 1
+            self._seconds[event.operation] += event.seconds
+            self._fraction_sizes[event.operation][event.fraction_size] += 1
+
+    def snapshot(self, reset: bool = False) -> dict[str, OperationStats]:
+        with self._lock:
+            stats = {
+                operation: OperationStats(
+                    sum(counts),
+                    self._seconds[operation],
+                    Histogram(self._bounds, tuple(counts)),
+                    dict(sorted(self._fraction_sizes[operation].items())),
+                )
+                for operation, counts in self._counts.items()
+            }
+            if reset:
+                self._counts.clear()
+                self._seconds.clear()
+                self._fraction_sizes.clear()
+            return stats
+
+    def reset(self) -> None:
+        self.snapshot(reset=True)
@@ -0,0 +1,64 @@
+import pytest
+
+from lexorank import lexorank
+from lexorank.hooks import Event, Histogram, HistogramAggregator
+
+
+def test_hooks():
+    events: list[Event] = []
+    lexorank.add_hook(events.append)
+    try:
+        a = lexorank.parse("0|i00000:")
+        b = a.next()
+        lexorank.between(a, lexorank.parse("0|i00001:"))
+        lexorank.between(None, a)
+        b.prev()
+    finally:
+        lexorank.remove_hook(events.append)
+    lexorank.parse("0|i00000:")
+
+    assert [(event.operation, event.fraction_size) for event in events] == [
+        ("parse", 0),
+        ("next", 0),
+        ("parse", 0),
+        ("between", 1),
+        ("between", 0),
+        ("prev", 0),
+    ]
+    assert all(event.seconds >= 0 for event in events)
+
+
+def test_remove_hook_unregistered():
+    with pytest.raises(ValueError):
+        lexorank.remove_hook(print)
+
+
+def test_histogram_aggregator():
+    aggregator = HistogramAggregator((1e-6, 1e-3))
+
+    aggregator(Event("between", 5e-7, 1))
+    aggregator(Event("between", 2e-4, 3))
+    aggregator(Event("between", 2e-4, 3))
+    aggregator(Event("parse", 2.0, 0))
+
+    stats = aggregator.snapshot(reset=True)
+    assert stats["between"].calls == 3
+    assert stats["between"].seconds == pytest.approx(4.005e-4)
+    assert stats["between"].latency == Histogram((1e-6, 1e-3), (1, 2, 0))
+    assert stats["between"].fraction_sizes == {1: 1, 3: 2}
+    assert stats["between"].max_fraction_size == 3
+    assert stats["parse"].latency.counts == (0, 0, 1)
+    assert aggregator.snapshot() == {}
+
+
+@pytest.mark.parametrize(
+    "counts,q,expected",
+    [
+        ((0, 0, 0), 0.5, 0.0),
+        ((1, 2, 0), 0.3, 1e-6),
+        ((1, 2, 0), 0.5, 1e-3),
+        ((1, 2, 1), 1.0, float("inf")),
+    ],
+)
+def test_histogram_quantile(counts, q, expected):
+    assert Histogram((1e-6, 1e-3), counts).quantile(q) == expected
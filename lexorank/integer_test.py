@@ -1,5 +1,7 @@
+import pytest
+
 from lexorank.base import Base10, Base36, Base64
-from lexorank.integer import parse
+from lexorank.integer import Integer, parse
 
 
 def test_parse():
@@ -17,6 +19,12 @@ def test_parse():
         assert got == c["want"]
 
 
+def test_init_rejects_non_int():
+    for value in ([1, 2, 3], "123", 1.5):
+        with pytest.raises(TypeError):
+            Integer(value)  # type: ignore[arg-type]
+
+
 def test_add():
     cases = [
         {"in": (123, 123, Base10)},
@@ -91,6 +99,7 @@ def test_rshift():
     cases = [
         {"in": (123, 1), "want": 123 // 36},
         {"in": (123, 11), "want": 0},
+        {"in": (-123, 1), "want": -(123 // 36)},
     ]
 
     for c in cases:
@@ -98,6 +107,19 @@ def test_rshift():
         assert (a >> c["in"][1]) == c["want"]
 
 
+def test_len():
+    cases = [
+        {"in": (0, Base10), "want": 0},
+        {"in": (123, Base10), "want": 3},
+        {"in": (-123, Base10), "want": 3},
+        {"in": (36**5, Base36), "want": 6},
+        {"in": (64**5 - 1, Base64), "want": 5},
+    ]
+
+    for c in cases:
+        assert len(parse(*c["in"])) == c["want"]
+
+
 def test_eq():
     cases = [
         {"in": (0, 0)},
@@ -121,6 +143,12 @@ def test_eq():
         assert (a == b) == (c["in"][0] == c["in"][1])
 
 
+def test_eq_foreign():
+    assert parse(123) != None  # noqa: E711
+    assert parse(123) != [1, 2, 3]
+    assert parse(123) == 123
+
+
 def test_gt():
     cases = [
         {"in": (0, 0)},
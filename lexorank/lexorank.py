@@ -1,16 +1,27 @@
 from enum import IntEnum
-from functools import lru_cache
+from fractions import Fraction
+from time import perf_counter
+from typing import Iterator, TypeVar
 
 from typing_extensions import Self
 
 from lexorank import decimal
-from lexorank.base import Base, Base36
+from lexorank.base import Base, Base36, encode
+from lexorank.cache import CacheInfo, LRUCache
 from lexorank.decimal import DECIMAL_POINT, Decimal
+from lexorank.hooks import Event, Hook
 from lexorank.integer import Integer
 
 BUCKET_SEPARATOR = "|"
 WHOLE_NUMBER_SIZE = 6
 
+_parse_cache: "LRUCache[tuple[str, Base, str, str, int], LexoRank] | None" = None
+_hooks: tuple[Hook, ...] = ()
+_ordered_alphabets: dict[Base, bool] = {}
+_middles: "dict[tuple[Bucket, Base, str, str, int], LexoRank]" = {}
+
+R = TypeVar("R", bound="LexoRank")
+
 
 class Bucket(IntEnum):
     BUCKET_0 = 0
@@ -21,7 +32,14 @@ class Bucket(IntEnum):
         return self.__class__((self.value + 1) % 3)
 
 
+class Towards(IntEnum):
+    A = 0
+    B = 1
+
+
 class LexoRank:
+    __slots__ = ("_bucket", "_rank", "_bucket_separator", "_whole_number_size", "_str", "_key")
+
     def __init__(
         self,
         bucekt: Bucket,
@@ -34,6 +52,8 @@ class LexoRank:
         self._rank = rank
         self._bucket_separator = bucket_separator
         self._whole_number_size = whole_number_size
+        self._str: str | None = None
+        self._key: str | None = None
 
     @property
     def bucket(self) -> Bucket:
@@ -43,13 +63,68 @@ class LexoRank:
     def rank(self) -> Decimal:
         return self._rank
 
+    @property
+    def bucket_separator(self) -> str:
+        return self._bucket_separator
+
+    @property
+    def whole_number_size(self) -> int:
+        return self._whole_number_size
+
     def prev(self, step: int = 16) -> Self:
-        return self.next(-step)
+        if _hooks:
+            start = perf_counter()
+            return _emit("prev", start, self._next(-step))
+        return self._next(-step)
 
     def next(self, step: int = 16) -> Self:
+        if _hooks:
+            start = perf_counter()
+            return _emit("next", start, self._next(step))
+        return self._next(step)
+
+    def _next(self, step: int) -> Self:
         return self.__class__(
             self._bucket,
-            Decimal(self._rank.whole_number(), 0, decimal_point=self._rank.decimal_point) + step,
+            Decimal(
+                int(self._rank) + step,
+                0,
+                base=self._rank.base,
+                decimal_point=self._rank.decimal_point,
+            ),
+            bucket_separator=self._bucket_separator,
+            whole_number_size=self._whole_number_size,
+        )
+
+    def interpolate(self, other: object, fraction: Fraction) -> Self:
+        other = self._type_guard(other)
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"fraction must be between 0 and 1: {fraction}")
+
+        start = Fraction(*self._rank.as_integer_ratio())
+        end = Fraction(*other._rank.as_integer_ratio())
+        target = start + (end - start) * fraction
+        base = self._rank.base
+        decimal_point = self._rank.decimal_point
+
+        try:
+            rank = decimal.from_fraction(target, base, decimal_point=decimal_point)
+        except ValueError:
+            # The exact value does not terminate in this base, so round it down with as few
+            # digits as keep it strictly after the lower end.
+            lower = min(start, end)
+            digits = 0
+            while True:
+                digits += 1
+                rank = decimal.from_fraction(
+                    target, base, decimal_point=decimal_point, digits=digits
+                )
+                if Fraction(*rank.as_integer_ratio()) > lower:
+                    break
+
+        return self.__class__(
+            self._bucket,
+            rank,
             bucket_separator=self._bucket_separator,
             whole_number_size=self._whole_number_size,
         )
@@ -85,38 +160,105 @@ class LexoRank:
         )
 
     def __eq__(self, other: object) -> bool:
-        other = self._type_guard(other)
-
-        return self._bucket == other._bucket and self._rank == other._rank
+        if not isinstance(other, (LexoRank, str, int, float, Integer, Decimal)):
+            return NotImplemented
+        return self._compare(other) == 0
 
     def __gt__(self, other: object) -> bool:
-        other = self._type_guard(other)
-
-        if self._bucket.value > other._bucket.value:
-            return True
-        if self._bucket.value < other._bucket.value:
-            return False
-        return self._rank > other._rank
+        return self._compare(other) > 0
 
     def __ge__(self, other: object):
-        return self.__gt__(other) or self.__eq__(other)
+        return self._compare(other) >= 0
 
     def __lt__(self, other: object):
-        return not self.__ge__(other)
+        return self._compare(other) < 0
 
     def __le__(self, other: object):
-        return not self.__gt__(other)
-
-    def __str__(self) -> str:
-        rank = str(self._rank)
-        index = rank.index(self._rank.decimal_point)
+        return self._compare(other) <= 0
+
+    def sort_key(self) -> str:
+        key = self._key if self._key is not None else self._lexical_key()
+        if not key:
+            raise ValueError(f"{self!r} does not order by its string form")
+        return key
+
+    def to_bytes(self) -> bytes:
+        # Two bits of bucket, then every digit in a fixed number of bits, zero padded to whole
+        # bytes. Fixed-width digits make byte order match rank order, and since a canonical
+        # fraction never ends in zero, a key that is a prefix of another is also the smaller rank.
+        rank = self._rank
+        if rank.significand < 0:
+            raise ValueError(f"{self} is negative")
+        radix = rank.base.base()
+        fraction_size = max(-rank.exponent, 0)
+        size = self._whole_number_size + fraction_size
+        value = rank.significand * radix ** (rank.exponent + fraction_size)
+        if value >= radix**size:
+            raise ValueError(f"{self} does not fit in {self._whole_number_size} whole digits")
+
+        width = (radix - 1).bit_length()
+        if radix == 1 << width:
+            packed = value
+        else:
+            packed = 0
+            for digit in encode(rank.base, value, size):
+                packed = packed << width | rank.base.to_base10(digit)
+        packed |= self._bucket.value << size * width
+
+        bits = 2 + size * width
+        padding = -bits % 8
+        return (packed << padding).to_bytes((bits + padding) // 8, "big")
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        base: Base = Base36,
+        *,
+        decimal_point: str = DECIMAL_POINT,
+        bucket_separator: str = BUCKET_SEPARATOR,
+        whole_number_size: int = WHOLE_NUMBER_SIZE,
+    ) -> Self:
+        radix = base.base()
+        width = (radix - 1).bit_length()
+        size = (len(data) * 8 - 2) // width
+        if size < whole_number_size:
+            raise ValueError(f"invalid lexorank bytes: {data!r}")
+        packed = int.from_bytes(data, "big") >> (len(data) * 8 - 2 - size * width)
+
+        fields = packed & ((1 << size * width) - 1)
+        if radix == 1 << width:
+            value = fields
+        else:
+            value = 0
+            mask = (1 << width) - 1
+            for shift in range((size - 1) * width, -1, -width):
+                digit = fields >> shift & mask
+                if digit >= radix:
+                    raise ValueError(f"invalid lexorank bytes: {data!r}")
+                value = value * radix + digit
+        bucket = packed >> size * width
+        if bucket >= len(Bucket):
+            raise ValueError(f"invalid lexorank bytes: {data!r}")
+
+        # Padding may read as extra zero digits, which the decimal strips again.
+        return cls(
+            Bucket(bucket),
+            Decimal(value, whole_number_size - size, base=base, decimal_point=decimal_point),
+            bucket_separator=bucket_separator,
+            whole_number_size=whole_number_size,
+        )
 
-        whole = rank[:index].zfill(self._whole_number_size)
-        rank = rank[index + 1 :]
+    def __hash__(self) -> int:
+        # Decimals are normalised, so equal ranks share their significand and exponent. Ranks
+        # also compare equal to strings and numbers without hashing alike, which breaks the hash
+        # contract: do not mix ranks with their strings in one set or as keys of one dict.
+        return hash((self._bucket, self._rank.significand, self._rank.exponent))
 
-        return (
-            f"{self._bucket.value}{self._bucket_separator}{whole}{self._rank.decimal_point}{rank}"
-        )
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = self._format()
+        return self._str
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} value={self} base={self._rank.base.base()}>"
@@ -127,6 +269,62 @@ class LexoRank:
     def __int__(self) -> int:
         return int(self._rank)
 
+    def _compare(self, other: object) -> int:
+        if isinstance(other, LexoRank):
+            key = self._key if self._key is not None else self._lexical_key()
+            other_key = other._key if other._key is not None else other._lexical_key()
+            if key and other_key and self._same_format(other):
+                return (key > other_key) - (key < other_key)
+
+        other = self._type_guard(other)
+        if self._bucket != other._bucket:
+            return 1 if self._bucket > other._bucket else -1
+        return (self._rank > other._rank) - (self._rank < other._rank)
+
+    def _same_format(self, other: "LexoRank") -> bool:
+        return (
+            self._rank.base is other._rank.base
+            and self._whole_number_size == other._whole_number_size
+            and self._bucket_separator == other._bucket_separator
+            and self._rank.decimal_point == other._rank.decimal_point
+        )
+
+    def _lexical_key(self) -> str:
+        # The canonical string sorts like the rank as long as the whole number fits in its
+        # padding, the value is not negative and the digits are in code point order. An empty
+        # key marks a rank that has to be compared numerically.
+        key = str(self)
+        if (
+            self._rank.significand < 0
+            or not _ordered_alphabet(self._rank.base)
+            or key[2 + self._whole_number_size] != self._rank.decimal_point
+        ):
+            key = ""
+        self._key = key
+        return key
+
+    def _format(self) -> str:
+        rank = self._rank
+        if rank.significand < 0:
+            rank_str = str(rank)
+            index = rank_str.index(rank.decimal_point)
+            whole = rank_str[:index].zfill(self._whole_number_size)
+            fraction = rank_str[index + 1 :]
+        elif rank.exponent >= 0:
+            whole = encode(
+                rank.base,
+                rank.significand * rank.base.base() ** rank.exponent,
+                self._whole_number_size,
+            )
+            fraction = ""
+        else:
+            # Encode once with enough leading zeros for both the padding and the fraction.
+            digits = encode(rank.base, rank.significand, self._whole_number_size - rank.exponent)
+            whole = digits[: rank.exponent]
+            fraction = digits[rank.exponent :]
+
+        return f"{self._bucket.value}{self._bucket_separator}{whole}{rank.decimal_point}{fraction}"
+
     def _type_guard(self, other: object) -> "LexoRank":
         if isinstance(other, LexoRank):
             return other
@@ -145,6 +343,15 @@ class LexoRank:
         raise ValueError(f"unsupported operand type(s) {type(other)}")
 
 
+def _ordered_alphabet(base: Base) -> bool:
+    ordered = _ordered_alphabets.get(base)
+    if ordered is None:
+        digits = [base.from_base10(digit) for digit in range(base.base())]
+        ordered = all(len(digit) == 1 for digit in digits) and digits == sorted(digits)
+        _ordered_alphabets[base] = ordered
+    return ordered
+
+
 def parse(
     value: str,
     base: Base = Base36,
@@ -152,6 +359,68 @@ def parse(
     decimal_point: str = DECIMAL_POINT,
     bucket_separator: str = BUCKET_SEPARATOR,
     whole_number_size: int = WHOLE_NUMBER_SIZE,
+) -> LexoRank:
+    if _hooks:
+        start = perf_counter()
+        rank = _cached_parse(value, base, decimal_point, bucket_separator, whole_number_size)
+        return _emit("parse", start, rank)
+    return _cached_parse(value, base, decimal_point, bucket_separator, whole_number_size)
+
+
+def _cached_parse(
+    value: str, base: Base, decimal_point: str, bucket_separator: str, whole_number_size: int
+) -> LexoRank:
+    cache = _parse_cache
+    if cache is None:
+        return _parse(value, base, decimal_point, bucket_separator, whole_number_size)
+
+    key = (value, base, decimal_point, bucket_separator, whole_number_size)
+    rank = cache.get(key)
+    if rank is None:
+        rank = cache.put(
+            key, _parse(value, base, decimal_point, bucket_separator, whole_number_size)
+        )
+    return rank
+
+
+def enable_parse_cache(maxsize: int = 4096) -> None:
+    global _parse_cache  # pylint: disable=global-statement
+    _parse_cache = LRUCache(maxsize)
+
+
+def disable_parse_cache() -> None:
+    global _parse_cache  # pylint: disable=global-statement
+    _parse_cache = None
+
+
+def parse_cache_info() -> CacheInfo | None:
+    cache = _parse_cache
+    return None if cache is None else cache.info()
+
+
+def add_hook(hook: Hook) -> None:
+    global _hooks  # pylint: disable=global-statement
+    # The tuple is replaced rather than mutated, so emitting never needs a lock.
+    _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook: Hook) -> None:
+    global _hooks  # pylint: disable=global-statement
+    if hook not in _hooks:
+        raise ValueError(f"hook is not registered: {hook!r}")
+    index = _hooks.index(hook)
+    _hooks = _hooks[:index] + _hooks[index + 1 :]
+
+
+def _emit(operation: str, start: float, rank: R) -> R:
+    event = Event(operation, perf_counter() - start, max(-rank.rank.exponent, 0))
+    for hook in _hooks:
+        hook(event)
+    return rank
+
+
+def _parse(
+    value: str, base: Base, decimal_point: str, bucket_separator: str, whole_number_size: int
 ) -> LexoRank:
     if value[1] != bucket_separator or value[2 + whole_number_size] != decimal_point:
         raise ValueError(f"invalid lexorank format: {value}")
@@ -163,7 +432,6 @@ def parse(
     )
 
 
-@lru_cache()
 def middle(
     bucket: Bucket,
     base: Base = Base36,
@@ -171,29 +439,159 @@ def middle(
     decimal_point: str = DECIMAL_POINT,
     bucket_separator: str = BUCKET_SEPARATOR,
     whole_number_size: int = WHOLE_NUMBER_SIZE,
+) -> LexoRank:
+    # Cached in a dict keyed by base, like _ordered_alphabet(): the Base protocol cannot promise
+    # the hashable arguments that lru_cache() asks for.
+    key = (bucket, base, decimal_point, bucket_separator, whole_number_size)
+    rank = _middles.get(key)
+    if rank is None:
+        rank = _middles[key] = _middle(*key)
+    return rank
+
+
+def _middle(
+    bucket: Bucket, base: Base, decimal_point: str, bucket_separator: str, whole_number_size: int
 ) -> LexoRank:
     max_decimal = decimal.parse("1" + "0" * whole_number_size, base, decimal_point=decimal_point)
     return LexoRank(
         bucket,
-        max_decimal * 0.5,
+        max_decimal.halve(),
         bucket_separator=bucket_separator,
         whole_number_size=whole_number_size,
     )
 
 
 def between(a: LexoRank | None, b: LexoRank | None) -> LexoRank:
+    if _hooks:
+        start = perf_counter()
+        return _emit("between", start, _between(a, b))
+    return _between(a, b)
+
+
+def _between(a: LexoRank | None, b: LexoRank | None) -> LexoRank:
     if a is None:
         if b is None:
             raise ValueError("a and b cannot be None at the same time")
-        return b.prev()
+        return b._next(-16)  # pylint: disable=protected-access
     if b is None:
-        return a.next()
+        return a._next(16)  # pylint: disable=protected-access
+
+    # Everything below works on the significands aligned to a common exponent, so no
+    # intermediate ranks are built.
+    a, lower, upper, exponent = _bounds(a, b)
+    if lower == upper:
+        raise ValueError(f"there is no rank between {a} and {b}")
+
+    scale = a.rank.base.base() ** -exponent
+    value, digits = _shortest(lower, upper, scale, lower + upper, 2 * scale, a.rank.base.base())
+    return _like(a, value, -digits)
 
-    if a > b:
-        a, b = b, a
-    mid = (a + b) * 0.5
-    if int(a) < int(mid) < int(b):
-        return LexoRank(a.bucket, decimal.parse(mid.rank.whole_number()))
 
-    # TODO: shorten the length of the decimal part
-    return mid
+def skewed_between(
+    a: LexoRank | None, b: LexoRank | None, towards: Towards, expected: int = 8
+) -> LexoRank:
+    if expected < 1:
+        raise ValueError(f"expected must be positive: {expected}")
+    if a is None or b is None:
+        return between(a, b)
+
+    low, lower, upper, exponent = _bounds(a, b)
+    if lower == upper:
+        raise ValueError(f"there is no rank between {a} and {b}")
+
+    # Leave room for the expected inserts on the hot side, as if they were spread evenly, so
+    # that its gap shrinks linearly instead of halving on every insert.
+    if (low is a) == (towards == Towards.A):
+        hot, cold = lower, upper
+    else:
+        hot, cold = upper, lower
+    gap = cold - hot
+    radix = low.rank.base.base()
+    scale = radix**-exponent
+
+    # Any rank within half a slot of the target will do, so take the shortest one there.
+    slots = 2 * (expected + 1)
+    first = hot * slots + gap * (2 * expected - 1)
+    last = hot * slots + gap * (2 * expected + 1)
+    value, digits = _shortest(
+        min(first, last),
+        max(first, last),
+        scale * slots,
+        hot * (expected + 1) + gap * expected,
+        scale * (expected + 1),
+        radix,
+    )
+    return _like(low, value, -digits)
+
+
+def spread(
+    a: LexoRank | None, b: LexoRank | None, n: int, step: int = 16, *, start: int = 0
+) -> Iterator[LexoRank]:
+    if n < 0:
+        raise ValueError(f"n must be non-negative: {n}")
+    if a is None:
+        if b is None:
+            raise ValueError("a and b cannot be None at the same time")
+        return (b.prev(step * (n - i)) for i in range(start, n))
+    if b is None:
+        return (a.next(step * (i + 1)) for i in range(start, n))
+
+    a, lower, upper, exponent = _bounds(a, b)
+    if lower == upper:
+        raise ValueError(f"there is no rank between {a} and {b}")
+
+    # Find the fewest fractional digits that leave room for n ranks strictly inside.
+    radix = a.rank.base.base()
+    scale = radix**-exponent
+    digits = 0
+    while True:
+        first = lower * radix**digits // scale
+        last = -(-upper * radix**digits // scale)
+        if last - first > n:
+            break
+        digits += 1
+
+    return (_like(a, first + (i + 1) * (last - first) // (n + 1), -digits) for i in range(start, n))
+
+
+def _bounds(a: LexoRank, b: LexoRank) -> tuple[LexoRank, int, int, int]:
+    # Returns the lower of the two ranks and both significands aligned to a common exponent.
+    if a.bucket != b.bucket:
+        raise ValueError(f"{a} and {b} are in different buckets")
+    rank_a = a.rank
+    rank_b = b.rank
+    radix = rank_a.base.base()
+    exponent = min(rank_a.exponent, rank_b.exponent, 0)
+    lower = rank_a.significand * radix ** (rank_a.exponent - exponent)
+    upper = rank_b.significand * radix ** (rank_b.exponent - exponent)
+    if lower > upper:
+        return b, upper, lower, exponent
+    return a, lower, upper, exponent
+
+
+def _shortest(
+    lower: int, upper: int, scale: int, numerator: int, denominator: int, radix: int
+) -> tuple[int, int]:
+    # Returns the value closest to numerator / denominator with the fewest fractional digits
+    # that lies strictly between lower / scale and upper / scale, as (significand, digits).
+    digits = 0
+    power = 1
+    while True:
+        first = lower * power // scale
+        last = -(-upper * power // scale)
+        if last - first > 1:
+            value = (2 * numerator * power + denominator) // (2 * denominator)
+            return min(max(value, first + 1), last - 1), digits
+        digits += 1
+        power *= radix
+
+
+def _like(template: LexoRank, value: int, exponent: int) -> LexoRank:
+    return LexoRank(
+        template.bucket,
+        Decimal(
+            value, exponent, base=template.rank.base, decimal_point=template.rank.decimal_point
+        ),
+        bucket_separator=template.bucket_separator,
+        whole_number_size=template.whole_number_size,
+    )
@@ -1,3 +1,8 @@
+import math
+from fractions import Fraction
+
+import pytest
+
 from lexorank import lexorank
 from lexorank.base import Base10, Base36, Base64
 from lexorank.lexorank import Bucket
@@ -17,6 +22,25 @@ def test_parse():
         assert str(got) == c["want"][2]
 
 
+def test_parse_cache():
+    lexorank.enable_parse_cache(2)
+    try:
+        a = lexorank.parse("0|i00000:")
+        assert lexorank.parse("0|i00000:") is a
+        assert lexorank.parse("0|i00000:", Base64) is not a
+        lexorank.parse("0|i00001:")
+        assert lexorank.parse("0|i00000:") is not a
+
+        info = lexorank.parse_cache_info()
+        assert info is not None
+        assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 4, 2, 2)
+    finally:
+        lexorank.disable_parse_cache()
+
+    assert lexorank.parse_cache_info() is None
+    assert lexorank.parse("0|i00000:") is not lexorank.parse("0|i00000:")
+
+
 def test_middle():
     cases = [
         {"in": (Bucket.BUCKET_0, Base10), "want": "0|500000:"},
@@ -77,3 +101,252 @@ def test_gt():
         got = lexorank.parse(c["in"][0], c["in"][2])
         other = lexorank.parse(c["in"][1], c["in"][2])
         assert (got > other) == c["want"]
+
+
+def test_sort():
+    cases = [
+        {
+            "in": (["0|00ri01:000000", "0|00ri00:z", "0|00ri01:0001", "0|00ri01:"], Base36),
+            "want": ["0|00ri00:z", "0|00ri01:", "0|00ri01:", "0|00ri01:0001"],
+        },
+        {
+            "in": (["1|000000:", "0|zzzzzz:zz", "0|000000:1", "2|000000:"], Base36),
+            "want": ["0|000000:1", "0|zzzzzz:zz", "1|000000:", "2|000000:"],
+        },
+        {
+            "in": (["0|00000a:", "0|00000_:", "0|00000Z:", "0|00000^:1"], Base64),
+            "want": ["0|00000Z:", "0|00000^:1", "0|00000_:", "0|00000a:"],
+        },
+    ]
+
+    for c in cases:
+        ranks = [lexorank.parse(value, c["in"][1]) for value in c["in"][0]]
+        assert [str(rank) for rank in sorted(ranks)] == c["want"]
+        assert [str(rank) for rank in sorted(ranks, key=lexorank.LexoRank.sort_key)] == c["want"]
+
+
+def test_sort_numeric_fallback():
+    top = lexorank.parse("0|zzzzzz:")
+    overflow = top.next()
+    negative = lexorank.parse("0|000000:").prev()
+
+    assert str(overflow) == "0|100000f:"
+    assert negative < top < overflow
+    assert sorted([overflow, top, negative]) == [negative, top, overflow]
+    with pytest.raises(ValueError):
+        overflow.sort_key()
+    with pytest.raises(ValueError):
+        negative.sort_key()
+
+
+def test_hash():
+    cases = [
+        {"in": ("0|00ri01:000000", "0|00ri01:", Base36), "want": True},
+        {"in": ("0|00ri01:", "1|00ri01:", Base36), "want": False},
+        {"in": ("0|000012:30", "0|000012:3", Base10), "want": True},
+    ]
+
+    for c in cases:
+        got = lexorank.parse(c["in"][0], c["in"][2])
+        other = lexorank.parse(c["in"][1], c["in"][2])
+        assert (got == other) == c["want"]
+        assert (hash(got) == hash(other)) == c["want"]
+        assert (len({got, other}) == 1) == c["want"]
+
+
+def test_eq_foreign():
+    got = lexorank.parse("0|i00000:")
+    assert got != None  # noqa: E711
+    assert got != object()
+    assert got in [None, got]
+    assert got == "0|i00000:"
+
+
+def test_slots():
+    got = lexorank.parse("0|i00000:i")
+    assert not hasattr(got, "__dict__")
+    assert not hasattr(got.rank, "__dict__")
+    assert str(got) is str(got)
+
+
+def test_between():
+    cases = [
+        {"in": ("0|i00000:", "0|i00001:", Base36), "want": "0|i00000:i"},
+        {"in": ("0|i00001:", "0|i00000:", Base36), "want": "0|i00000:i"},
+        {"in": ("0|i00000:", None, Base36), "want": "0|i0000g:"},
+        {"in": (None, "0|i00000:", Base36), "want": "0|hzzzzk:"},
+        {"in": ("0|000001:", "0|000003:", Base10), "want": "0|000002:"},
+        {"in": ("0|i00000:", "0|i0000g:", Base36), "want": "0|i00008:"},
+        {"in": ("0|i00000:abc", "0|i00000:abd", Base36), "want": "0|i00000:abci"},
+        {"in": ("0|00000W:1", "0|00000W:2", Base64), "want": "0|00000W:1W"},
+        {"in": ("0|i00000:abc", "0|i00000:b", Base36), "want": "0|i00000:ao"},
+        {"in": ("0|000001:9", "0|000004:01", Base10), "want": "0|000003:"},
+        {"in": ("0|000001:19", "0|000001:2", Base10), "want": "0|000001:195"},
+    ]
+
+    for c in cases:
+        a = None if c["in"][0] is None else lexorank.parse(c["in"][0], c["in"][2])
+        b = None if c["in"][1] is None else lexorank.parse(c["in"][1], c["in"][2])
+        assert str(lexorank.between(a, b)) == c["want"]
+
+
+def test_between_invalid():
+    a = lexorank.parse("0|i00000:")
+
+    with pytest.raises(ValueError):
+        lexorank.between(None, None)
+    with pytest.raises(ValueError):
+        lexorank.between(a, lexorank.parse("0|i00000:000"))
+    with pytest.raises(ValueError, match="different buckets"):
+        lexorank.between(lexorank.parse("1|000001:"), a)
+
+
+def test_skewed_between():
+    cases = [
+        {"in": ("0|i00000:", "0|i00001:", lexorank.Towards.A, 8), "want": "0|i00000:w"},
+        {"in": ("0|i00000:", "0|i00001:", lexorank.Towards.B, 8), "want": "0|i00000:4"},
+        {"in": ("0|i00001:", "0|i00000:", lexorank.Towards.B, 8), "want": "0|i00000:w"},
+        {"in": ("0|i00000:", "0|i00001:", lexorank.Towards.A, 1), "want": "0|i00000:i"},
+        {"in": ("0|i00000:", None, lexorank.Towards.A, 8), "want": "0|i0000g:"},
+    ]
+
+    for c in cases:
+        a = lexorank.parse(c["in"][0])
+        b = None if c["in"][1] is None else lexorank.parse(c["in"][1])
+        assert str(lexorank.skewed_between(a, b, c["in"][2], c["in"][3])) == c["want"]
+
+    with pytest.raises(ValueError, match="different buckets"):
+        lexorank.skewed_between(
+            lexorank.parse("1|000001:"), lexorank.parse("0|i00000:"), lexorank.Towards.A
+        )
+
+
+def test_skewed_between_hotspot():
+    head = lexorank.parse("0|i00000:")
+    skewed = plain = lexorank.parse("0|i00001:")
+
+    for _ in range(100):
+        skewed = lexorank.skewed_between(head, skewed, lexorank.Towards.A)
+        plain = lexorank.between(head, plain)
+        assert head < skewed
+
+    assert -skewed.rank.exponent * 2 < -plain.rank.exponent
+
+
+def test_interpolate():
+    cases = [
+        {"in": ("0|000000:", "0|000001:", Fraction(1, 4), Base10), "want": "0|000000:25"},
+        {"in": ("0|000000:", "0|000001:", Fraction(1, 3), Base10), "want": "0|000000:3"},
+        {"in": ("0|000000:", "0|000001:", Fraction(1, 3), Base36), "want": "0|000000:c"},
+        {"in": ("0|000000:", "0|000000:1", Fraction(1, 3000), Base10), "want": "0|000000:00003"},
+        {"in": ("0|000001:", "0|000000:", Fraction(1, 4), Base10), "want": "0|000000:75"},
+        {"in": ("0|i00000:", "0|i00010:", Fraction(0), Base36), "want": "0|i00000:"},
+    ]
+
+    for c in cases:
+        a = lexorank.parse(c["in"][0], c["in"][3])
+        b = lexorank.parse(c["in"][1], c["in"][3])
+        assert str(lexorank.LexoRank.interpolate(a, b, c["in"][2])) == c["want"]
+
+
+def test_spread():
+    cases = [
+        {
+            "in": ("0|i00000:", "0|i00001:", 5, Base36),
+            "want": ["0|i00000:6", "0|i00000:c", "0|i00000:i", "0|i00000:o", "0|i00000:u"],
+        },
+        {
+            "in": ("0|000010:", "0|000000:", 3, Base10),
+            "want": ["0|000002:", "0|000005:", "0|000007:"],
+        },
+        {"in": ("0|000001:", "0|000002:", 1, Base10), "want": ["0|000001:5"]},
+        {"in": ("0|000001:", "0|000002:", 0, Base10), "want": []},
+        {"in": ("0|i00000:", None, 2, Base36), "want": ["0|i0000g:", "0|i0000w:"]},
+        {"in": (None, "0|i00000:", 2, Base36), "want": ["0|hzzzz4:", "0|hzzzzk:"]},
+    ]
+
+    for c in cases:
+        a = None if c["in"][0] is None else lexorank.parse(c["in"][0], c["in"][3])
+        b = None if c["in"][1] is None else lexorank.parse(c["in"][1], c["in"][3])
+        assert [str(rank) for rank in lexorank.spread(a, b, c["in"][2])] == c["want"]
+
+
+def test_spread_is_shortest():
+    a = lexorank.parse("0|i00000:z")
+    b = lexorank.parse("0|i00001:0001")
+    lower = Fraction(*a.rank.as_integer_ratio())
+    upper = Fraction(*b.rank.as_integer_ratio())
+
+    for n in (1, 10, 100, 1000, 5000):
+        ranks = list(lexorank.spread(a, b, n))
+        assert len(ranks) == n
+        assert all(x < y for x, y in zip([a] + ranks, ranks + [b]))
+
+        # One fractional digit fewer would not leave room for n ranks.
+        scale = 36 ** (max(-rank.rank.exponent for rank in ranks) - 1)
+        assert math.ceil(upper * scale) - math.floor(lower * scale) - 1 < n
+
+
+def test_spread_invalid():
+    a = lexorank.parse("0|i00000:")
+
+    with pytest.raises(ValueError):
+        lexorank.spread(None, None, 1)
+    with pytest.raises(ValueError):
+        lexorank.spread(a, a, 1)
+    with pytest.raises(ValueError):
+        lexorank.spread(a, None, -1)
+    with pytest.raises(ValueError, match="different buckets"):
+        lexorank.spread(lexorank.parse("1|000001:"), a, 3)
+
+
+def test_bytes():
+    cases = [
+        ("0|000000:", Base36, 6, b"\x00\x00\x00\x00\x00"),
+        ("1|000001:", Base36, 6, b"\x40\x00\x00\x00\x04"),
+        ("2|zzzzzz:z", Base36, 6, b"\xa3\x8e\x38\xe3\x8e\x30"),
+        ("0|9:5", Base10, 1, b"\x25\x40"),
+        ("1|zz:_", Base64, 2, b"\x7f\xfe\x50"),
+    ]
+
+    for value, base, whole_number_size, expected in cases:
+        rank = lexorank.parse(value, base, whole_number_size=whole_number_size)
+        data = rank.to_bytes()
+        assert data == expected
+        assert (
+            str(lexorank.LexoRank.from_bytes(data, base, whole_number_size=whole_number_size))
+            == value
+        )
+
+
+def test_bytes_order():
+    values = [
+        "0|000000:",
+        "0|000000:001",
+        "0|000000:01",
+        "0|000000:1",
+        "0|000000:10001",
+        "0|000000:9",
+        "0|000001:",
+        "0|999999:99",
+        "1|000000:",
+        "2|500000:5",
+    ]
+
+    for base in (Base10, Base36, Base64):
+        ranks = [lexorank.parse(value, base) for value in values]
+        assert sorted(ranks, key=lexorank.LexoRank.to_bytes) == ranks
+        assert sorted(ranks[::-1], key=lexorank.LexoRank.to_bytes) == ranks
+
+
+def test_bytes_invalid():
+    with pytest.raises(ValueError):
+        (lexorank.parse("0|000001:") - lexorank.parse("0|000002:")).to_bytes()
+    with pytest.raises(ValueError):
+        lexorank.parse("0|zzzzzz:").next().to_bytes()
+    with pytest.raises(ValueError):
+        lexorank.LexoRank.from_bytes(b"\x00")
+    with pytest.raises(ValueError):
+        lexorank.LexoRank.from_bytes(b"\xc0\x00\x00\x00\x00")
+    with pytest.raises(ValueError):
+        lexorank.LexoRank.from_bytes(b"\xff\xff\xff\xff\xff", Base10)
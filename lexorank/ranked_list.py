@@ -0,0 +1,269 @@
+import random
+from time import perf_counter
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+from lexorank.base import Base, Base36
+from lexorank.decimal import DECIMAL_POINT
+from lexorank.hooks import Event, Hook
+from lexorank.lexorank import BUCKET_SEPARATOR, WHOLE_NUMBER_SIZE, Bucket, LexoRank, between, middle
+
+V = TypeVar("V")
+
+_MAX_LEVEL = 32
+
+
+class _Node:
+    __slots__ = ("rank", "value", "next", "width")
+
+    def __init__(self, rank: Any, value: Any, level: int) -> None:
+        self.rank = rank
+        self.value = value
+        self.next: list[_Node] = [self] * level
+        # The number of bottom-level steps to the next node on each level.
+        self.width = [1] * level
+
+
+class RankedList(Generic[V]):
+    def __init__(
+        self,
+        items: Iterable[tuple[LexoRank, V]] = (),
+        base: Base = Base36,
+        *,
+        decimal_point: str = DECIMAL_POINT,
+        bucket_separator: str = BUCKET_SEPARATOR,
+        whole_number_size: int = WHOLE_NUMBER_SIZE,
+        hook: Hook | None = None,
+        seed: int | None = None,
+    ) -> None:
+        # The rank the first item gets in an empty list.
+        self._middle = middle(
+            Bucket.BUCKET_0,
+            base,
+            decimal_point=decimal_point,
+            bucket_separator=bucket_separator,
+            whole_number_size=whole_number_size,
+        )
+        self._hook = hook
+        self._random = random.Random(seed)
+
+        # An indexable skip list: the tail sentinel sorts after every rank, and the widths make
+        # positional lookups as cheap as lookups by rank.
+        self._tail = _Node(None, None, _MAX_LEVEL)
+        self._head = _Node(None, None, _MAX_LEVEL)
+        self._head.next = [self._tail] * _MAX_LEVEL
+        self._level = 1
+        self._size = 0
+
+        for rank, value in items:
+            self.add(rank, value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple[LexoRank, V]]:
+        return self._iterate(self._head.next[0], None)
+
+    def __contains__(self, rank: object) -> bool:
+        if not isinstance(rank, LexoRank):
+            return False
+        node = self._find(rank)[0].next[0]
+        return node is not self._tail and node.rank == rank
+
+    def __getitem__(self, index: int) -> tuple[LexoRank, V]:
+        start = perf_counter() if self._hook is not None else 0.0
+        node = self._node_at(index)
+        if self._hook is not None:
+            self._emit("getitem", start, node.rank)
+        return node.rank, node.value
+
+    def get(self, rank: LexoRank, default: Any = None) -> V | Any:
+        node = self._find(rank)[0].next[0]
+        if node is self._tail or node.rank != rank:
+            return default
+        return node.value
+
+    def index(self, rank: LexoRank) -> int:
+        start = perf_counter() if self._hook is not None else 0.0
+        node, position = self._find(rank)
+        node = node.next[0]
+        if node is self._tail or node.rank != rank:
+            raise ValueError(f"{rank} is not in the list")
+        if self._hook is not None:
+            self._emit("index", start, rank)
+        return position
+
+    def add(self, rank: LexoRank, value: V) -> int:
+        start = perf_counter() if self._hook is not None else 0.0
+        position = self._insert(rank, value)
+        if self._hook is not None:
+            self._emit("add", start, rank)
+        return position
+
+    def insert_at(self, index: int, value: V) -> LexoRank:
+        start = perf_counter() if self._hook is not None else 0.0
+        if not 0 <= index <= self._size:
+            raise IndexError(f"index out of range: {index}")
+        # The chain ends at the neighbours of the new item, so they come for free.
+        chain, steps = self._chain_by_index(index)
+        rank = self._rank_between(chain[0].rank, chain[0].next[0].rank)
+        self._link(chain, steps, rank, value)
+        if self._hook is not None:
+            self._emit("insert_at", start, rank)
+        return rank
+
+    def move(self, source: int, destination: int) -> LexoRank:
+        # The destination is the index the item ends up at.
+        start = perf_counter() if self._hook is not None else 0.0
+        if not 0 <= destination < self._size:
+            raise IndexError(f"index out of range: {destination}")
+        rank, value = self._remove_at(source)
+        chain, steps = self._chain_by_index(destination)
+        if source != destination:
+            rank = self._rank_between(chain[0].rank, chain[0].next[0].rank)
+        self._link(chain, steps, rank, value)
+        if self._hook is not None:
+            self._emit("move", start, rank)
+        return rank
+
+    def pop(self, index: int = -1) -> tuple[LexoRank, V]:
+        start = perf_counter() if self._hook is not None else 0.0
+        rank, value = self._remove_at(index)
+        if self._hook is not None:
+            self._emit("pop", start, rank)
+        return rank, value
+
+    def remove(self, rank: LexoRank) -> V:
+        return self._remove(rank)[1]
+
+    def irange(
+        self, minimum: LexoRank | None = None, maximum: LexoRank | None = None
+    ) -> Iterator[tuple[LexoRank, V]]:
+        # Ranks from minimum up to and including maximum.
+        node = self._head if minimum is None else self._find(minimum)[0]
+        return self._iterate(node.next[0], maximum)
+
+    def islice(self, start: int = 0, stop: int | None = None) -> Iterator[tuple[LexoRank, V]]:
+        start, stop, _ = slice(start, stop).indices(self._size)
+        node = self._node_at(start) if start < self._size else self._tail
+        for _ in range(start, stop):
+            yield node.rank, node.value
+            node = node.next[0]
+
+    def _iterate(self, node: _Node, maximum: LexoRank | None) -> Iterator[tuple[LexoRank, V]]:
+        while node is not self._tail and (maximum is None or node.rank <= maximum):
+            yield node.rank, node.value
+            node = node.next[0]
+
+    def _rank_between(self, lower: LexoRank | None, upper: LexoRank | None) -> LexoRank:
+        if lower is None and upper is None:
+            return self._middle
+        return between(lower, upper)
+
+    def _node_at(self, index: int) -> _Node:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"index out of range: {index}")
+
+        node = self._head
+        remaining = index + 1
+        for level in range(self._level - 1, -1, -1):
+            while node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node
+
+    def _find(self, rank: LexoRank) -> tuple[_Node, int]:
+        # Returns the last node before rank and the index just after it.
+        chain, steps = self._chain_by_rank(rank)
+        return chain[0], sum(steps)
+
+    def _chain_by_rank(self, rank: LexoRank) -> tuple[list[_Node], list[int]]:
+        # The last node before rank on every level, and the steps taken on each level.
+        chain = [self._head] * _MAX_LEVEL
+        steps = [0] * _MAX_LEVEL
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = node.next[level]
+            while following is not self._tail and following.rank < rank:
+                steps[level] += node.width[level]
+                node = following
+                following = node.next[level]
+            chain[level] = node
+        return chain, steps
+
+    def _chain_by_index(self, index: int) -> tuple[list[_Node], list[int]]:
+        # Same as _chain_by_rank() for the node at index, but walking the widths instead of
+        # comparing ranks.
+        chain = [self._head] * _MAX_LEVEL
+        steps = [0] * _MAX_LEVEL
+        node = self._head
+        travelled = 0
+        for level in range(self._level - 1, -1, -1):
+            while travelled + node.width[level] <= index:
+                travelled += node.width[level]
+                steps[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+        return chain, steps
+
+    def _insert(self, rank: LexoRank, value: V) -> int:
+        chain, steps = self._chain_by_rank(rank)
+        following = chain[0].next[0]
+        if following is not self._tail and following.rank == rank:
+            raise ValueError(f"{rank} is already in the list")
+        return self._link(chain, steps, rank, value)
+
+    def _link(self, chain: list[_Node], steps: list[int], rank: LexoRank, value: V) -> int:
+        level = 1
+        while level < _MAX_LEVEL and self._random.random() < 0.5:
+            level += 1
+        for unused in range(self._level, level):
+            # Unused head levels point straight at the tail, past every item.
+            self._head.width[unused] = self._size + 1
+        self._level = max(self._level, level)
+
+        new = _Node(rank, value, level)
+        distance = 0
+        for height in range(level):
+            previous = chain[height]
+            new.next[height] = previous.next[height]
+            previous.next[height] = new
+            new.width[height] = previous.width[height] - distance
+            previous.width[height] = distance + 1
+            distance += steps[height]
+        for height in range(level, self._level):
+            chain[height].width[height] += 1
+
+        self._size += 1
+        return sum(steps)
+
+    def _remove(self, rank: LexoRank) -> tuple[LexoRank, V]:
+        chain, _ = self._chain_by_rank(rank)
+        target = chain[0].next[0]
+        if target is self._tail or target.rank != rank:
+            raise KeyError(f"{rank} is not in the list")
+        return self._unlink(chain)
+
+    def _remove_at(self, index: int) -> tuple[LexoRank, V]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"index out of range: {index}")
+        return self._unlink(self._chain_by_index(index)[0])
+
+    def _unlink(self, chain: list[_Node]) -> tuple[LexoRank, V]:
+        target = chain[0].next[0]
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), self._level):
+            chain[level].width[level] -= 1
+
+        self._size -= 1
+        return target.rank, target.value
+
+    def _emit(self, operation: str, start: float, rank: LexoRank) -> None:
+        assert self._hook is not None
+        self._hook(Event(operation, perf_counter() - start, max(-rank.rank.exponent, 0)))
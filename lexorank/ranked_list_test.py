@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from lexorank import lexorank
+from lexorank.hooks import Event
+from lexorank.ranked_list import RankedList
+
+
+def values(ranked: RankedList) -> list:
+    return [value for _, value in ranked]
+
+
+def test_insert_at():
+    ranked: RankedList[str] = RankedList(seed=0)
+
+    assert str(ranked.insert_at(0, "b")) == "0|i00000:"
+    assert str(ranked.insert_at(0, "a")) == "0|hzzzzk:"
+    assert str(ranked.insert_at(2, "d")) == "0|i0000g:"
+    assert str(ranked.insert_at(2, "c")) == "0|i00008:"
+
+    assert values(ranked) == ["a", "b", "c", "d"]
+    assert [ranked[i][1] for i in range(4)] == ["a", "b", "c", "d"]
+    assert ranked[-1][1] == "d"
+    with pytest.raises(IndexError):
+        ranked.insert_at(5, "e")
+    with pytest.raises(IndexError):
+        ranked[4]  # pylint: disable=pointless-statement
+
+
+def test_move():
+    ranked: RankedList[str] = RankedList(seed=0)
+    for index, value in enumerate("abcde"):
+        ranked.insert_at(index, value)
+
+    ranked.move(0, 4)
+    assert values(ranked) == ["b", "c", "d", "e", "a"]
+    ranked.move(3, 1)
+    assert values(ranked) == ["b", "e", "c", "d", "a"]
+    rank = ranked[2][0]
+    assert ranked.move(2, 2) == rank
+
+    ranks = [rank for rank, _ in ranked]
+    assert ranks == sorted(ranks)
+
+
+def test_lookup_by_rank():
+    ranks = [lexorank.parse(f"0|00000{i}:") for i in range(1, 6)]
+    ranked = RankedList(((rank, i) for i, rank in enumerate(reversed(ranks))), seed=0)
+
+    assert [rank for rank, _ in ranked] == ranks
+    assert ranked.index(ranks[3]) == 3
+    assert ranked.get(ranks[0]) == 4
+    assert ranked.get(lexorank.parse("0|000009:")) is None
+    assert ranks[2] in ranked
+    assert ranked.remove(ranks[2]) == 2
+    assert ranks[2] not in ranked
+    with pytest.raises(ValueError):
+        ranked.index(ranks[2])
+    with pytest.raises(ValueError):
+        ranked.add(ranks[0], 0)
+
+
+def test_ranges():
+    ranks = [lexorank.parse(f"0|00000{i}:") for i in range(1, 6)]
+    ranked = RankedList(((rank, i) for i, rank in enumerate(ranks)), seed=0)
+
+    assert [i for _, i in ranked.irange(ranks[1], ranks[3])] == [1, 2, 3]
+    assert [i for _, i in ranked.irange(lexorank.parse("0|000003:1"))] == [3, 4]
+    assert [i for _, i in ranked.islice(1, 3)] == [1, 2]
+    assert [i for _, i in ranked.islice(-2)] == [3, 4]
+    assert not list(ranked.islice(5))
+
+
+def test_matches_list():
+    rng = random.Random(0)
+    ranked: RankedList[int] = RankedList(seed=0)
+    expected: list[tuple[lexorank.LexoRank, int]] = []
+
+    for value in range(500):
+        if len(expected) < 2 or rng.random() < 0.6:
+            index = rng.randint(0, len(expected))
+            expected.insert(index, (ranked.insert_at(index, value), value))
+        elif rng.random() < 0.7:
+            source = rng.randrange(len(expected))
+            destination = rng.randrange(len(expected))
+            rank = ranked.move(source, destination)
+            expected.insert(destination, (rank, expected.pop(source)[1]))
+        else:
+            index = rng.randrange(len(expected))
+            assert ranked.pop(index) == expected.pop(index)
+
+    assert list(ranked) == expected
+    assert [ranked.index(rank) for rank, _ in expected] == list(range(len(expected)))
+
+
+def test_hook():
+    events: list[Event] = []
+    ranked: RankedList[str] = RankedList(hook=events.append, seed=0)
+
+    ranked.insert_at(0, "a")
+    ranked.insert_at(1, "b")
+    ranked.move(1, 0)
+    ranked.pop()
+
+    assert [event.operation for event in events] == ["insert_at", "insert_at", "move", "pop"]
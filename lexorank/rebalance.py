@@ -0,0 +1,303 @@
+from bisect import bisect_left
+from itertools import chain
+from itertools import count as counter
+from typing import Any, Hashable, Iterable, Iterator, NamedTuple, Sequence, TypeVar
+
+from lexorank.decimal import Decimal
+from lexorank.lexorank import Bucket, LexoRank, between, spread
+
+K = TypeVar("K", bound=Hashable)
+
+Item = LexoRank | tuple[K, LexoRank]
+
+
+class RebalanceCursor(NamedTuple):
+    position: int
+    old_rank: LexoRank
+    new_rank: LexoRank
+
+
+class RebalanceBatch(NamedTuple):
+    items: list[Any]
+    cursor: RebalanceCursor
+
+
+class Compaction(NamedTuple):
+    item: Any
+    rank: LexoRank
+
+
+def rebalance(
+    items: Iterable[Item],
+    count: int | None = None,
+    *,
+    chunk_size: int = 1000,
+    cursor: RebalanceCursor | None = None,
+    step: int = 16,
+) -> Iterator[RebalanceBatch]:
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive: {chunk_size}")
+
+    iterator = iter(items)
+    first = next(iterator, None)
+    if first is None:
+        return
+    iterator = chain((first,), iterator)
+
+    template = rank_of(first)
+    position = 0 if cursor is None else cursor.position
+    previous = None if cursor is None else cursor.old_rank
+    new_ranks = _new_ranks(template, count, step, position)
+
+    batch: list[Any] = []
+    for item in iterator:
+        rank = rank_of(item)
+        if rank.bucket != template.bucket:
+            raise ValueError(f"{rank} is not in bucket {template.bucket.value}")
+        if previous is not None and rank <= previous:
+            raise ValueError(f"ranks are not in ascending order: {previous}, {rank}")
+
+        try:
+            new_rank = next(new_ranks)
+        except StopIteration:
+            raise ValueError(f"more than {count} items to rebalance") from None
+
+        batch.append(replace_rank(item, new_rank))
+        previous = rank
+        position += 1
+        if len(batch) == chunk_size:
+            yield RebalanceBatch(batch, RebalanceCursor(position, rank, new_rank))
+            batch = []
+
+    if batch:
+        yield RebalanceBatch(batch, RebalanceCursor(position, rank, new_rank))
+
+
+def merge_migration(
+    old: Iterable[Item], new: Iterable[Item], boundary: RebalanceCursor | None
+) -> Iterator[Item]:
+    # Rows are migrated in order, so the new bucket up to the boundary is the head of the list
+    # and the old bucket after the boundary is its tail. Old rows at or before the boundary have
+    # already been migrated and are skipped.
+    if boundary is None:
+        yield from old
+        yield from new
+        return
+
+    new_iter = iter(new)
+    ahead = None
+    for item in new_iter:
+        if rank_of(item) > boundary.new_rank:
+            ahead = item
+            break
+        yield item
+
+    for item in old:
+        if rank_of(item) > boundary.old_rank:
+            yield item
+
+    # New-bucket rows past the boundary were written ahead of the migration and belong at the end.
+    if ahead is not None:
+        yield ahead
+    yield from new_iter
+
+
+def compact(items: Iterable[Item], max_digits: int) -> Iterator[Compaction]:
+    if max_digits < 0:
+        raise ValueError(f"max_digits must be non-negative: {max_digits}")
+
+    iterator = iter(items)
+    item = next(iterator, None)
+    if item is None:
+        return
+
+    template = rank_of(item)
+    # The neighbour on the left is the rank the previous item ends up with, so a run of long
+    # ranks is compacted one after another.
+    lower = _whole_number(template, template.bucket, 0)
+    previous = None
+    while item is not None:
+        following = next(iterator, None)
+        rank = rank_of(item)
+        if rank.bucket != template.bucket:
+            raise ValueError(f"{rank} is not in bucket {template.bucket.value}")
+        if previous is not None and rank <= previous:
+            raise ValueError(f"ranks are not in ascending order: {previous}, {rank}")
+
+        if -rank.rank.exponent > max_digits and lower < rank:
+            if following is None:
+                upper = _whole_number(template, rank.bucket, _ceiling(template))
+            else:
+                upper = rank_of(following)
+            if rank < upper:
+                if following is None or previous is None:
+                    # The first and last rows have only one neighbour, so rather than halfway to
+                    # the edge of the bucket they move as little as they can.
+                    shorter = _nearest(lower, rank, upper)
+                else:
+                    shorter = between(lower, upper)
+                if shorter.rank.exponent > rank.rank.exponent:
+                    yield Compaction(item, shorter)
+                    rank = shorter
+
+        previous = rank_of(item)
+        lower = rank
+        item = following
+
+
+def reorder(old: Iterable[tuple[K, LexoRank]], new_order: Sequence[K]) -> list[tuple[K, LexoRank]]:
+    ranks = dict(old)
+    if len(new_order) != len(ranks) or set(new_order) != ranks.keys():
+        raise ValueError("new_order must be a permutation of the keys in old")
+    if not ranks:
+        return []
+
+    template = next(iter(ranks.values()))
+    floor = _whole_number(template, template.bucket, 0)
+    ceiling = _whole_number(template, template.bucket, _ceiling(template))
+    for rank in ranks.values():
+        if rank.bucket != template.bucket:
+            raise ValueError(f"{rank} is not in bucket {template.bucket.value}")
+        if not floor <= rank < ceiling:
+            raise ValueError(f"{rank} is outside the whole-number range of its bucket")
+
+    # The longest run of keys whose old ranks are already ascending in the new order keeps its
+    # ranks, so only the keys outside it are written.
+    order = sorted(ranks, key=ranks.__getitem__)
+    position = {key: index for index, key in enumerate(order)}
+    for previous_key, key in zip(order, order[1:]):
+        if ranks[previous_key] == ranks[key]:
+            raise ValueError(f"{previous_key} and {key} share the rank {ranks[key]}")
+    kept = _longest_increasing([position[key] for key in new_order])
+
+    changed: list[tuple[K, LexoRank]] = []
+    lower: LexoRank | None = None
+    run: list[K] = []
+    for index, key in enumerate(new_order):
+        if index not in kept:
+            run.append(key)
+            continue
+        if run:
+            changed.extend(zip(run, _spread_run(lower, ranks[key], len(run), floor, ceiling)))
+            run = []
+        lower = ranks[key]
+    if run:
+        changed.extend(zip(run, _spread_run(lower, None, len(run), floor, ceiling)))
+    return changed
+
+
+def rank_of(item: Item) -> LexoRank:
+    return item if isinstance(item, LexoRank) else item[1]
+
+
+def replace_rank(item: Item, rank: LexoRank) -> Item:
+    return rank if isinstance(item, LexoRank) else (item[0], rank)
+
+
+def _new_ranks(
+    template: LexoRank, count: int | None, step: int, position: int
+) -> Iterator[LexoRank]:
+    bucket = template.bucket.next()
+
+    if count is None:
+        # Without a total there is nothing to spread over, so step from the bottom of the bucket.
+        return _step_from(_whole_number(template, bucket, 0), step, position, _ceiling(template))
+
+    # Spread the whole list evenly over the entire whole-number range of the next bucket.
+    return spread(
+        _whole_number(template, bucket, 0),
+        _whole_number(template, bucket, _ceiling(template)),
+        count,
+        start=position,
+    )
+
+
+def _spread_run(
+    lower: LexoRank | None,
+    upper: LexoRank | None,
+    n: int,
+    floor: LexoRank,
+    ceiling: LexoRank,
+    *,
+    step: int = 16,
+) -> Iterator[LexoRank]:
+    # Runs at either end step away from their anchor as appends do, so moving items to an end
+    # only uses up the room they need. Near the edge of the bucket they share what is left.
+    if lower is None and upper is not None and upper.prev(step * n) < floor:
+        lower = floor
+    elif upper is None and lower is not None and lower.next(step * n) >= ceiling:
+        upper = ceiling
+    return spread(lower, upper, n, step)
+
+
+def _step_from(origin: LexoRank, step: int, position: int, ceiling: int) -> Iterator[LexoRank]:
+    for i in counter(position):
+        rank = origin.next(step * (i + 1))
+        if int(rank.rank) >= ceiling:
+            raise ValueError(f"no room for {i + 1} ranks in bucket {origin.bucket.value}")
+        yield rank
+
+
+def _longest_increasing(values: list[int]) -> set[int]:
+    # Patience sorting: tails[length] is the index of the smallest value ending an increasing
+    # subsequence of length + 1, and the predecessors link each index to the one before it.
+    tails: list[int] = []
+    tail_values: list[int] = []
+    predecessors = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length > 0:
+            predecessors[index] = tails[length - 1]
+        if length == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[length] = index
+            tail_values[length] = value
+
+    indices = set()
+    index = tails[-1] if tails else -1
+    while index >= 0:
+        indices.add(index)
+        index = predecessors[index]
+    return indices
+
+
+def _nearest(lower: LexoRank, rank: LexoRank, upper: LexoRank) -> LexoRank:
+    # Of the ranks with the fewest digits strictly between lower and upper, the closest to rank.
+    radix = rank.rank.base.base()
+    for digits in range(-rank.rank.exponent):
+        scale = radix ** (-rank.rank.exponent - digits)
+        below, remainder = divmod(rank.rank.significand, scale)
+        candidates = [
+            (distance, _with_digits(rank, value, digits))
+            for distance, value in [(remainder, below), (scale - remainder, below + 1)]
+        ]
+        fitting = [
+            (distance, shorter) for distance, shorter in candidates if lower < shorter < upper
+        ]
+        if fitting:
+            return min(fitting, key=lambda candidate: candidate[0])[1]
+    return rank
+
+
+def _ceiling(template: LexoRank) -> int:
+    return template.rank.base.base() ** template.whole_number_size
+
+
+def _with_digits(template: LexoRank, value: int, digits: int) -> LexoRank:
+    return LexoRank(
+        template.bucket,
+        Decimal(value, -digits, base=template.rank.base, decimal_point=template.rank.decimal_point),
+        bucket_separator=template.bucket_separator,
+        whole_number_size=template.whole_number_size,
+    )
+
+
+def _whole_number(template: LexoRank, bucket: Bucket, value: int) -> LexoRank:
+    return LexoRank(
+        bucket,
+        Decimal(value, 0, base=template.rank.base, decimal_point=template.rank.decimal_point),
+        bucket_separator=template.bucket_separator,
+        whole_number_size=template.whole_number_size,
+    )
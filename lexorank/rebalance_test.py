@@ -0,0 +1,226 @@
+import random
+
+import pytest
+
+from lexorank import lexorank, rebalance
+from lexorank.base import Base10
+from lexorank.lexorank import Bucket
+
+
+def test_rebalance():
+    ranks = [lexorank.parse(f"0|i00000:{'1' * (i + 1)}") for i in range(5)]
+
+    batches = list(rebalance.rebalance(ranks, len(ranks), chunk_size=2))
+
+    assert [len(batch.items) for batch in batches] == [2, 2, 1]
+    got = [rank for batch in batches for rank in batch.items]
+    assert [str(rank) for rank in got] == [
+        "1|600000:",
+        "1|c00000:",
+        "1|i00000:",
+        "1|o00000:",
+        "1|u00000:",
+    ]
+    assert batches[-1].cursor == rebalance.RebalanceCursor(5, ranks[-1], got[-1])
+
+
+def test_rebalance_pairs():
+    items = [(f"id{i}", lexorank.parse(f"2|00000{i}:1", Base10)) for i in range(3)]
+
+    got = [item for batch in rebalance.rebalance(items) for item in batch.items]
+
+    assert [(key, str(rank)) for key, rank in got] == [
+        ("id0", "0|000016:"),
+        ("id1", "0|000032:"),
+        ("id2", "0|000048:"),
+    ]
+    assert all(rank.bucket == Bucket.BUCKET_0 for _, rank in got)
+
+
+def test_rebalance_resume():
+    ranks = [lexorank.parse(f"0|i0000{i}:1") for i in range(7)]
+    want = [rank for batch in rebalance.rebalance(ranks, len(ranks)) for rank in batch.items]
+
+    batches = rebalance.rebalance(ranks, len(ranks), chunk_size=3)
+    cursor = next(batches).cursor
+    resumed = rebalance.rebalance(ranks[cursor.position :], len(ranks), cursor=cursor)
+    got = [rank for batch in resumed for rank in batch.items]
+
+    assert got == want[cursor.position :]
+
+
+def test_rebalance_invalid():
+    a = lexorank.parse("0|i00000:")
+    b = lexorank.parse("0|i00001:")
+
+    with pytest.raises(ValueError):
+        list(rebalance.rebalance([b, a]))
+    with pytest.raises(ValueError):
+        list(rebalance.rebalance([a, lexorank.parse("1|i00001:")]))
+    with pytest.raises(ValueError):
+        list(rebalance.rebalance([a, b], 1))
+    with pytest.raises(ValueError):
+        list(rebalance.rebalance([a], chunk_size=0))
+
+    # Without a count, the steps must still fit into the whole-number range.
+    ranks = [lexorank.parse(f"0|00000{i}:", Base10) for i in range(3)]
+    assert len(list(rebalance.rebalance(ranks[:2], step=400000))) == 1
+    with pytest.raises(ValueError, match="no room"):
+        list(rebalance.rebalance(ranks, step=400000))
+
+
+def test_merge_migration():
+    old = [(f"id{i}", lexorank.parse(f"0|i0000{i}:")) for i in range(6)]
+    migrated = next(rebalance.rebalance(old, len(old), chunk_size=3))
+
+    # The reader sees the migrated head in the new bucket, an item inserted into it since,
+    # and the untouched tail in the old bucket.
+    inserted = ("new", lexorank.between(migrated.items[1][1], migrated.items[2][1]))
+    new = migrated.items[:2] + [inserted] + migrated.items[2:]
+
+    got = list(rebalance.merge_migration(old, new, migrated.cursor))
+
+    assert [key for key, _ in got] == ["id0", "id1", "new", "id2", "id3", "id4", "id5"]
+
+
+def test_merge_migration_is_lazy():
+    def old():
+        yield lexorank.parse("0|i00001:")
+        raise AssertionError("read too far")
+
+    new = [lexorank.parse("1|000001:"), lexorank.parse("1|000002:")]
+    boundary = rebalance.RebalanceCursor(1, lexorank.parse("0|i00000:"), new[-1])
+
+    got = rebalance.merge_migration(old(), new, boundary)
+
+    assert [next(got), next(got), next(got)] == new + [lexorank.parse("0|i00001:")]
+
+
+def test_merge_migration_not_started():
+    old = [lexorank.parse("0|i00000:"), lexorank.parse("0|i00001:")]
+
+    assert list(rebalance.merge_migration(old, [], None)) == old
+
+
+def test_compact():
+    items = [
+        ("a", lexorank.parse("0|i00000:")),
+        ("b", lexorank.parse("0|i00000:00001")),
+        ("c", lexorank.parse("0|i00000:0001")),
+        ("d", lexorank.parse("0|i00000:1")),
+        ("e", lexorank.parse("0|i00001:zzzz")),
+    ]
+
+    got = list(rebalance.compact(items, 1))
+
+    assert [(change.item[0], str(change.rank)) for change in got] == [
+        ("c", "0|i00000:0i"),
+        ("e", "0|i00002:"),
+    ]
+    for change in got:
+        assert change.item in items
+
+    cases = [
+        {"in": ["0|000005:1234", "0|000006:"], "want": ["0|000005:"]},
+        {"in": ["0|000000:1234", "0|000006:"], "want": ["0|000001:"]},
+        {"in": ["0|000000:0123", "0|000000:5"], "want": ["0|000000:1"]},
+        {"in": ["0|000001:", "0|zzzzzz:zz"], "want": ["0|zzzzzz:"]},
+    ]
+    for c in cases:
+        got = rebalance.compact([lexorank.parse(rank) for rank in c["in"]], 1)
+        assert [str(change.rank) for change in got] == c["want"]
+
+
+def test_compact_keeps_order():
+    ranks = [lexorank.parse("0|000000:1"), lexorank.parse("0|000000:2")]
+    for _ in range(30):
+        ranks.insert(1, lexorank.between(ranks[0], ranks[1]))
+    # Deleting most of the rows leaves room for much shorter ranks.
+    ranks = ranks[::6]
+
+    changes = {change.item: change.rank for change in rebalance.compact(ranks, 2)}
+    got = [changes.get(rank, rank) for rank in ranks]
+
+    assert changes
+    assert all(rank.rank.exponent > item.rank.exponent for item, rank in changes.items())
+    assert all(x < y for x, y in zip(got, got[1:]))
+
+
+def test_compact_invalid():
+    a = lexorank.parse("0|i00000:")
+    b = lexorank.parse("0|i00001:")
+
+    with pytest.raises(ValueError):
+        list(rebalance.compact([b, a], 0))
+    with pytest.raises(ValueError):
+        list(rebalance.compact([a, lexorank.parse("1|i00001:")], 0))
+
+
+def test_reorder():
+    old = [(key, lexorank.parse(f"0|00000{i}:")) for i, key in enumerate("abcdef", 1)]
+
+    got = rebalance.reorder(old, ["b", "c", "a", "d", "f", "e"])
+
+    assert [(key, str(rank)) for key, rank in got] == [("a", "0|000003:i"), ("f", "0|000004:i")]
+
+
+def test_reorder_keeps_order():
+    old = [
+        (i, rank) for i, rank in enumerate(lexorank.spread(None, lexorank.parse("0|i00000:"), 50))
+    ]
+    new_order = list(range(50))
+    random.Random(0).shuffle(new_order)
+
+    changes = dict(rebalance.reorder(old, new_order))
+    ranks = dict(old) | changes
+    got = [ranks[key] for key in new_order]
+
+    assert len(changes) < 50
+    assert all(x < y for x, y in zip(got, got[1:]))
+
+
+def test_reorder_ends():
+    old = [("a", "0|i00000:"), ("b", "0|i0000g:"), ("c", "0|i0000w:")]
+    ranks = {key: lexorank.parse(rank) for key, rank in old}
+
+    got = rebalance.reorder(ranks.items(), ["b", "c", "a"])
+    assert [(key, str(rank)) for key, rank in got] == [("a", "0|i0001c:")]
+    got = rebalance.reorder(ranks.items(), ["c", "a", "b"])
+    assert [(key, str(rank)) for key, rank in got] == [("c", "0|hzzzzk:")]
+
+    # Rotating the list keeps appending whole numbers instead of halving the room that is left.
+    order = ["a", "b", "c"]
+    for _ in range(100):
+        order = order[1:] + order[:1]
+        ranks.update(rebalance.reorder(ranks.items(), order))
+        assert all(ranks[x] < ranks[y] for x, y in zip(order, order[1:]))
+    assert all(rank.rank.exponent == 0 for rank in ranks.values())
+
+    # Close to the edge of the bucket the run shares what is left of it.
+    cases = [
+        {"in": ([("a", "0|00000a:"), ("b", "0|zzzzzx:")], ["b", "a"]), "want": ("b", "0|000005:")},
+        {
+            "in": ([("a", "0|000001:"), ("b", "0|zzzzzw:"), ("c", "0|zzzzzx:")], ["b", "c", "a"]),
+            "want": ("a", "0|zzzzzy:"),
+        },
+    ]
+    for c in cases:
+        old = [(key, lexorank.parse(rank)) for key, rank in c["in"][0]]
+        got = rebalance.reorder(old, c["in"][1])
+        assert [(key, str(rank)) for key, rank in got] == [c["want"]]
+
+
+@pytest.mark.parametrize(
+    "old,new_order",
+    [
+        ([("a", "0|000001:"), ("b", "0|000002:")], ["a"]),
+        ([("a", "0|000001:"), ("b", "0|000002:")], ["a", "a"]),
+        ([("a", "0|000001:"), ("b", "1|000002:")], ["b", "a"]),
+        ([("a", "0|000001:"), ("b", "0|000001:")], ["b", "a"]),
+        ([("a", "0|-0000g:"), ("b", "0|000000:")], ["b", "a"]),
+        ([("a", "0|000000:"), ("b", "1|000000:")], ["a", "b"]),
+    ],
+)
+def test_reorder_invalid(old, new_order):
+    with pytest.raises(ValueError):
+        rebalance.reorder([(key, lexorank.parse(rank)) for key, rank in old], new_order)
@@ -0,0 +1,60 @@
+import asyncio
+
+from lexorank.lexorank import LexoRank, between, spread
+
+Gap = tuple[LexoRank | None, LexoRank | None]
+
+
+class RankService:
+    def __init__(self, window: float = 0.005, max_batch: int | None = None) -> None:
+        if window < 0:
+            raise ValueError(f"window must be non-negative: {window}")
+        if max_batch is not None and max_batch <= 0:
+            raise ValueError(f"max_batch must be positive: {max_batch}")
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: dict[Gap, tuple[list[asyncio.Future[LexoRank]], asyncio.TimerHandle]] = {}
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def max_batch(self) -> int | None:
+        return self._max_batch
+
+    async def between(self, a: LexoRank | None, b: LexoRank | None) -> LexoRank:
+        loop = asyncio.get_running_loop()
+        gap = (a, b)
+        pending = self._pending.get(gap)
+        if pending is None:
+            pending = self._pending[gap] = ([], loop.call_later(self._window, self._flush, gap))
+
+        future: asyncio.Future[LexoRank] = loop.create_future()
+        pending[0].append(future)
+        if self._max_batch is not None and len(pending[0]) >= self._max_batch:
+            self._flush(gap)
+        return await future
+
+    def _flush(self, gap: Gap) -> None:
+        futures, timer = self._pending.pop(gap)
+        timer.cancel()
+        futures = [future for future in futures if not future.done()]
+        if not futures:
+            return
+
+        # Callers are answered in arrival order with ascending ranks spread over the gap. A lone
+        # caller gets exactly what between() would return.
+        try:
+            if len(futures) == 1:
+                ranks = [between(*gap)]
+            else:
+                ranks = list(spread(*gap, len(futures)))
+        except Exception as error:
+            # Every caller must hear back, whatever went wrong.
+            for future in futures:
+                future.set_exception(error)
+            return
+
+        for future, rank in zip(futures, ranks):
+            future.set_result(rank)
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from lexorank import lexorank
+from lexorank.service import RankService
+
+
+def test_between_coalesces():
+    a = lexorank.parse("0|i00000:")
+    b = lexorank.parse("0|i00001:")
+
+    async def run() -> list[lexorank.LexoRank]:
+        service = RankService(window=0.01)
+        return list(await asyncio.gather(*(service.between(a, b) for _ in range(5))))
+
+    got = asyncio.run(run())
+
+    assert [str(rank) for rank in got] == [
+        "0|i00000:6",
+        "0|i00000:c",
+        "0|i00000:i",
+        "0|i00000:o",
+        "0|i00000:u",
+    ]
+
+
+def test_between_single():
+    a = lexorank.parse("0|i00000:")
+    b = lexorank.parse("0|i00001:")
+
+    async def run() -> lexorank.LexoRank:
+        return await RankService().between(a, b)
+
+    assert asyncio.run(run()) == lexorank.between(a, b)
+
+
+def test_between_max_batch():
+    a = lexorank.parse("0|i00000:")
+
+    async def run() -> list[lexorank.LexoRank]:
+        service = RankService(window=60, max_batch=2)
+        return list(await asyncio.gather(service.between(a, None), service.between(a, None)))
+
+    assert [str(rank) for rank in asyncio.run(run())] == ["0|i0000g:", "0|i0000w:"]
+
+
+def test_between_error():
+    a = lexorank.parse("0|i00000:")
+
+    async def run() -> None:
+        service = RankService(window=0)
+        await asyncio.gather(service.between(a, a), service.between(a, a))
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+def test_between_unexpected_error():
+    a = lexorank.parse("0|i00000:")
+
+    async def run() -> None:
+        service = RankService(window=0)
+        # Not a rank, so between() fails with something other than a ValueError.
+        await asyncio.wait_for(service.between(a, 5), 1)  # type: ignore[arg-type]
+
+    with pytest.raises(AttributeError):
+        asyncio.run(run())
+
+
+def test_between_cancelled():
+    a = lexorank.parse("0|i00000:")
+    b = lexorank.parse("0|i00001:")
+
+    async def run() -> lexorank.LexoRank:
+        service = RankService(window=0.01)
+        cancelled = asyncio.ensure_future(service.between(a, b))
+        waiting = asyncio.ensure_future(service.between(a, b))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await waiting
+
+    assert asyncio.run(run()) == lexorank.between(a, b)
@@ -0,0 +1,291 @@
+import sqlite3
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import Iterator, Protocol, Sequence
+
+from lexorank import rebalance
+from lexorank.base import Base, Base36
+from lexorank.decimal import DECIMAL_POINT
+from lexorank.lexorank import (
+    BUCKET_SEPARATOR,
+    WHOLE_NUMBER_SIZE,
+    Bucket,
+    LexoRank,
+    between,
+    middle,
+    parse,
+    spread,
+)
+
+
+class RankStore(Protocol):
+    def insert_at(self, list_id: str, item_id: str, index: int) -> LexoRank:
+        ...
+
+    def move_before(self, list_id: str, item_id: str, target_id: str) -> LexoRank:
+        ...
+
+    def move_after(self, list_id: str, item_id: str, target_id: str) -> LexoRank:
+        ...
+
+    def move_many(
+        self, list_id: str, item_ids: Sequence[str], after: str | None = None
+    ) -> list[LexoRank]:
+        ...
+
+    def items(self, list_id: str) -> list[tuple[str, LexoRank]]:
+        ...
+
+
+class SQLiteRankStore:
+    def __init__(
+        self,
+        database: str,
+        base: Base = Base36,
+        *,
+        decimal_point: str = DECIMAL_POINT,
+        bucket_separator: str = BUCKET_SEPARATOR,
+        whole_number_size: int = WHOLE_NUMBER_SIZE,
+        max_digits: int = 8,
+        table: str = "ranks",
+        timeout: float = 30.0,
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError(f"invalid table name: {table}")
+        if database in ("", ":memory:"):
+            # Every thread opens its own connection, which would get its own private database.
+            raise ValueError("SQLiteRankStore needs a database file that all threads can open")
+        self._database = database
+        self._base = base
+        self._decimal_point = decimal_point
+        self._bucket_separator = bucket_separator
+        self._whole_number_size = whole_number_size
+        self._max_digits = max_digits
+        self._table = table
+        self._timeout = timeout
+        # Each thread works on its own connection; close() closes all of them.
+        self._local = local()
+        self._lock = Lock()
+        self._connections: list[sqlite3.Connection] = []
+
+        # WAL lets readers run alongside the single writer, and commits only append to the log.
+        self._connection().execute("PRAGMA journal_mode=WAL")
+        with self._transaction() as cursor:
+            # Canonical rank strings sort like the ranks themselves under the default binary
+            # collation, so the unique index doubles as the ordering index.
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "list_id TEXT NOT NULL, item_id TEXT NOT NULL, rank TEXT NOT NULL, "
+                "PRIMARY KEY (list_id, item_id))"
+            )
+            cursor.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {table}_list_rank ON {table} (list_id, rank)"
+            )
+
+    def insert_at(self, list_id: str, item_id: str, index: int) -> LexoRank:
+        if index < 0:
+            raise ValueError(f"index must be non-negative: {index}")
+        with self._transaction() as cursor:
+            if index == 0:
+                lower = None
+                upper = self._fetch_rank(
+                    cursor,
+                    f"SELECT rank FROM {self._table} WHERE list_id = ? ORDER BY rank LIMIT 1",
+                    (list_id,),
+                )
+            else:
+                rows = cursor.execute(
+                    f"SELECT rank FROM {self._table} WHERE list_id = ? "
+                    "ORDER BY rank LIMIT 2 OFFSET ?",
+                    (list_id, index - 1),
+                ).fetchall()
+                if not rows:
+                    raise IndexError(f"index out of range: {index}")
+                lower = self._parse(rows[0][0])
+                upper = self._parse(rows[1][0]) if len(rows) > 1 else None
+
+            rank = self._between(lower, upper)
+            # Park the new row on a placeholder until _assign() has checked that the rank fits.
+            cursor.execute(
+                f"INSERT INTO {self._table} (list_id, item_id, rank) VALUES (?, ?, '~' || ?)",
+                (list_id, item_id, item_id),
+            )
+            return self._assign(cursor, list_id, {item_id: rank})[0]
+
+    def move_before(self, list_id: str, item_id: str, target_id: str) -> LexoRank:
+        return self._move(list_id, item_id, target_id, before=True)
+
+    def move_after(self, list_id: str, item_id: str, target_id: str) -> LexoRank:
+        return self._move(list_id, item_id, target_id, before=False)
+
+    def move_many(
+        self, list_id: str, item_ids: Sequence[str], after: str | None = None
+    ) -> list[LexoRank]:
+        if not item_ids:
+            return []
+        if len(set(item_ids)) != len(item_ids) or after in item_ids:
+            raise ValueError("item_ids must be distinct and must not contain after")
+
+        with self._transaction() as cursor:
+            moved = ", ".join("?" * len(item_ids))
+            found = cursor.execute(
+                f"SELECT COUNT(*) FROM {self._table} WHERE list_id = ? AND item_id IN ({moved})",
+                (list_id, *item_ids),
+            ).fetchone()[0]
+            if found != len(item_ids):
+                raise KeyError(f"not every item is in list {list_id}")
+
+            lower = None if after is None else self._rank_of(cursor, list_id, after)
+            query = f"SELECT rank FROM {self._table} WHERE list_id = ? AND item_id NOT IN ({moved})"
+            params: tuple = (list_id, *item_ids)
+            if lower is not None:
+                query += " AND rank > ?"
+                params += (str(lower),)
+            upper = self._fetch_rank(cursor, query + " ORDER BY rank LIMIT 1", params)
+
+            if lower is None and upper is None:
+                lower = self._middle()
+            ranks = list(spread(lower, upper, len(item_ids)))
+
+            # The new ranks may equal old ranks of other moved items, so park the moved items on
+            # placeholders that sort after every rank before assigning the real ones.
+            cursor.execute(
+                f"UPDATE {self._table} SET rank = '~' || item_id "
+                f"WHERE list_id = ? AND item_id IN ({moved})",
+                (list_id, *item_ids),
+            )
+            return self._assign(cursor, list_id, dict(zip(item_ids, ranks)))
+
+    def items(self, list_id: str) -> list[tuple[str, LexoRank]]:
+        cursor = self._connection().execute(
+            f"SELECT item_id, rank FROM {self._table} WHERE list_id = ? ORDER BY rank",
+            (list_id,),
+        )
+        return [(item_id, self._parse(rank)) for item_id, rank in cursor]
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local.connection = None
+
+    def _move(self, list_id: str, item_id: str, target_id: str, before: bool) -> LexoRank:
+        if item_id == target_id:
+            raise ValueError(f"cannot move {item_id} next to itself")
+        with self._transaction() as cursor:
+            self._rank_of(cursor, list_id, item_id)
+            target = self._rank_of(cursor, list_id, target_id)
+            operator, order = ("<", "DESC") if before else (">", "ASC")
+            neighbour = self._fetch_rank(
+                cursor,
+                f"SELECT rank FROM {self._table} WHERE list_id = ? AND item_id != ? "
+                f"AND rank {operator} ? ORDER BY rank {order} LIMIT 1",
+                (list_id, item_id, str(target)),
+            )
+
+            rank = self._between(neighbour, target) if before else self._between(target, neighbour)
+            return self._assign(cursor, list_id, {item_id: rank})[0]
+
+    def _assign(
+        self, cursor: sqlite3.Cursor, list_id: str, changed: dict[str, LexoRank]
+    ) -> list[LexoRank]:
+        if all(self._fits(rank) for rank in changed.values()):
+            cursor.executemany(
+                f"UPDATE {self._table} SET rank = ? WHERE list_id = ? AND item_id = ?",
+                [(str(rank), list_id, item_id) for item_id, rank in changed.items()],
+            )
+            return list(changed.values())
+
+        # A rank past the threshold or outside the whole-number range means the list has run out
+        # of short ranks somewhere, so the whole list moves to the next bucket within the same
+        # transaction. Such a rank is never written, as its string would not sort like the rank.
+        rows = cursor.execute(
+            f"SELECT item_id, rank FROM {self._table} WHERE list_id = ?", (list_id,)
+        ).fetchall()
+        items = sorted(
+            (
+                (item_id, changed[item_id] if item_id in changed else self._parse(rank))
+                for item_id, rank in rows
+            ),
+            key=lambda item: item[1],
+        )
+        moved: dict[str, LexoRank] = {}
+        for batch in rebalance.rebalance(items, len(items), chunk_size=len(items)):
+            cursor.executemany(
+                f"UPDATE {self._table} SET rank = ? WHERE list_id = ? AND item_id = ?",
+                [(str(rank), list_id, item_id) for item_id, rank in batch.items],
+            )
+            moved.update(batch.items)
+        return [moved[item_id] for item_id in changed]
+
+    def _fits(self, rank: LexoRank) -> bool:
+        if -rank.rank.exponent > self._max_digits:
+            return False
+        return 0 <= rank.rank and int(rank.rank) < self._base.base() ** self._whole_number_size
+
+    def _between(self, lower: LexoRank | None, upper: LexoRank | None) -> LexoRank:
+        if lower is None and upper is None:
+            return self._middle()
+        return between(lower, upper)
+
+    def _middle(self) -> LexoRank:
+        return middle(
+            Bucket.BUCKET_0,
+            self._base,
+            decimal_point=self._decimal_point,
+            bucket_separator=self._bucket_separator,
+            whole_number_size=self._whole_number_size,
+        )
+
+    def _rank_of(self, cursor: sqlite3.Cursor, list_id: str, item_id: str) -> LexoRank:
+        rank = self._fetch_rank(
+            cursor,
+            f"SELECT rank FROM {self._table} WHERE list_id = ? AND item_id = ?",
+            (list_id, item_id),
+        )
+        if rank is None:
+            raise KeyError(f"{item_id} is not in list {list_id}")
+        return rank
+
+    def _fetch_rank(self, cursor: sqlite3.Cursor, query: str, params: tuple) -> LexoRank | None:
+        row = cursor.execute(query, params).fetchone()
+        return None if row is None else self._parse(row[0])
+
+    def _parse(self, value: str) -> LexoRank:
+        return parse(
+            value,
+            self._base,
+            decimal_point=self._decimal_point,
+            bucket_separator=self._bucket_separator,
+            whole_number_size=self._whole_number_size,
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Transactions are managed explicitly, see _transaction(). Only close() touches a
+            # connection from another thread.
+            connection = sqlite3.connect(
+                self._database,
+                timeout=self._timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        # BEGIN IMMEDIATE takes the write lock before the neighbours are read, so concurrent
+        # writers queue up instead of computing the same rank and failing on the unique index.
+        cursor = self._connection().cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
@@ -0,0 +1,142 @@
+import sqlite3
+from threading import Thread
+
+import pytest
+
+from lexorank.base import Base10
+from lexorank.store import SQLiteRankStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteRankStore(str(tmp_path / "ranks.db"))
+    yield store
+    store.close()
+
+
+def ids(store: SQLiteRankStore, list_id: str = "list") -> list[str]:
+    return [item_id for item_id, _ in store.items(list_id)]
+
+
+def test_insert_at(store):
+    assert str(store.insert_at("list", "b", 0)) == "0|i00000:"
+    store.insert_at("list", "a", 0)
+    store.insert_at("list", "d", 2)
+    store.insert_at("list", "c", 2)
+    store.insert_at("other", "x", 0)
+
+    assert ids(store) == ["a", "b", "c", "d"]
+    assert ids(store, "other") == ["x"]
+    with pytest.raises(IndexError):
+        store.insert_at("list", "e", 5)
+
+
+def test_move(store):
+    for index, item_id in enumerate("abcd"):
+        store.insert_at("list", item_id, index)
+
+    store.move_before("list", "d", "a")
+    assert ids(store) == ["d", "a", "b", "c"]
+    store.move_after("list", "d", "c")
+    assert ids(store) == ["a", "b", "c", "d"]
+    store.move_after("list", "a", "b")
+    assert ids(store) == ["b", "a", "c", "d"]
+
+    with pytest.raises(KeyError):
+        store.move_before("list", "e", "a")
+    with pytest.raises(ValueError):
+        store.move_before("list", "a", "a")
+
+
+def test_move_many(store):
+    for index, item_id in enumerate("abcdef"):
+        store.insert_at("list", item_id, index)
+
+    store.move_many("list", ["e", "a", "c"], after="f")
+    assert ids(store) == ["b", "d", "f", "e", "a", "c"]
+    store.move_many("list", ["c", "b"])
+    assert ids(store) == ["c", "b", "d", "f", "e", "a"]
+    store.move_many("list", list("abcdef"))
+    assert ids(store) == list("abcdef")
+
+    with pytest.raises(KeyError):
+        store.move_many("list", ["a", "z"])
+    assert ids(store) == list("abcdef")
+
+
+def test_rebalance(tmp_path):
+    store = SQLiteRankStore(str(tmp_path / "ranks.db"), max_digits=1)
+    store.insert_at("list", "a", 0)
+    store.insert_at("list", "b", 1)
+    for i in range(15):
+        store.insert_at("list", f"x{i}", 1)
+
+    items = store.items("list")
+    assert [item_id for item_id, _ in items] == ["a"] + [f"x{i}" for i in range(14, -1, -1)] + ["b"]
+    assert all(-rank.rank.exponent <= 1 for _, rank in items)
+    assert items[0][1].bucket.value == 1
+    store.close()
+
+
+def test_rebalance_whole_number_range(tmp_path):
+    store = SQLiteRankStore(str(tmp_path / "ranks.db"), Base10, whole_number_size=2)
+    for i in range(10):
+        store.insert_at("list", f"t{i}", i)
+    for i in range(10):
+        store.insert_at("list", f"h{i}", 0)
+
+    items = store.items("list")
+    assert [item_id for item_id, _ in items] == [f"h{i}" for i in range(9, -1, -1)] + [
+        f"t{i}" for i in range(10)
+    ]
+    assert all(0 <= rank.rank and int(rank.rank) < 100 for _, rank in items)
+    store.close()
+
+
+def test_concurrent_writers(tmp_path):
+    database = str(tmp_path / "ranks.db")
+    SQLiteRankStore(database).close()
+
+    def worker(worker_id: int) -> None:
+        store = SQLiteRankStore(database)
+        for i in range(10):
+            store.insert_at("list", f"{worker_id}-{i}", i % 3)
+        store.close()
+
+    threads = [Thread(target=worker, args=(worker_id,)) for worker_id in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    store = SQLiteRankStore(database)
+    assert len(store.items("list")) == 40
+    store.close()
+
+
+def test_shared_store(tmp_path):
+    store = SQLiteRankStore(str(tmp_path / "ranks.db"))
+    connections = []
+
+    def worker(worker_id: int) -> None:
+        for i in range(5):
+            store.insert_at("list", f"{worker_id}-{i}", 0)
+        connections.append(store._connection())  # pylint: disable=protected-access
+
+    threads = [Thread(target=worker, args=(worker_id,)) for worker_id in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store.items("list")) == 15
+    store.close()
+    # The connections the workers opened are closed as well.
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+
+def test_memory_database():
+    with pytest.raises(ValueError):
+        SQLiteRankStore(":memory:")